@@ -4,97 +4,259 @@ ChemScreen Prototype - Batch Chemical Literature Search Tool
 A Streamlit multipage application for librarians to perform batch literature searches
 on chemicals for regulatory assessments.
 
-This is the main/home page of the application.
+This is the entrypoint of the application: it performs the shared bootstrap
+(configuration, session state, styling and sidebar) once per rerun and then
+runs the selected page via ``st.navigation``.
 """
 
 import logging
-import sys
-from pathlib import Path
+from typing import TYPE_CHECKING
 
 import streamlit as st
 
-# Add the chemscreen package to the path
-sys.path.append(str(Path(__file__).parent))
+if TYPE_CHECKING:
+    from streamlit.commands.page_config import MenuItems
+
+    from chemscreen.config import Config
+
+
+# Static page configuration and layout
+_MENU_ITEMS: "MenuItems" = {
+    "Get Help": "https://github.com/clockworkmind/chemscreen-proto",
+    "Report a bug": "https://github.com/clockworkmind/chemscreen-proto/issues",
+    "About": "ChemScreen Prototype v1.0 - Batch Chemical Literature Search Tool",
+}
+# Page routing table: (script path, title, icon), in navigation order after Home
+_PAGES: tuple[tuple[str, str, str], ...] = (
+    ("pages/1_📤_Upload_Chemicals.py", "Upload Chemicals", "📤"),
+    ("pages/2_🔍_Search.py", "Search", "🔍"),
+    ("pages/3_📊_Results.py", "Results", "📊"),
+    ("pages/4_📥_Export.py", "Export", "📥"),
+    ("pages/5_📜_History.py", "History", "📜"),
+)
+_HOME_COLUMN_RATIOS = (2, 1)
+_QUICK_START_COLUMNS = 3
+_FEATURE_COLUMNS = 3
+_STATS_REFRESH_INTERVAL = "5s"
+_CONFIG_WARNINGS_TTL = 300  # seconds
+
+# Rough manual screening effort saved per chemical (2.5 minutes, in hours)
+_HOURS_PER_CHEMICAL = 2.5 / 60
+
+# Current session status messages
+_ACTIVE_BATCH_MSG = "Active Batch: {}"
+_NO_SESSION_MSG = "No active search session"
+_CHEMICALS_READY_MSG = "✅ {} chemicals ready"
+_NO_CHEMICALS_MSG = "⚠️ No chemicals loaded"
+_RESULTS_AVAILABLE_MSG = "📊 {} results available"
+
+# Static home page content
+_WELCOME_MD = """
+### Welcome to ChemScreen
+
+ChemScreen is a specialized tool designed for librarians supporting regulatory chemical risk assessments.
+It enables batch processing of chemical literature searches, reducing screening time from days to hours.
+
+#### 🎯 Key Features:
+- **Batch Processing**: Search 100+ chemicals simultaneously
+- **Quality Scoring**: Automated literature quality assessment
+- **Smart Caching**: Avoid redundant API calls
+- **Export Options**: CSV and Excel formats
+- **Progress Tracking**: Real-time search status
+
+#### 🚀 Getting Started:
+1. **Upload** your chemical list (CSV format)
+2. **Configure** search parameters
+3. **Run** the batch search
+4. **Export** results for analysis
+
+#### 📊 Typical Workflow:
+- Upload a CSV with chemical names or CAS numbers
+- Review and validate the chemical list
+- Start the batch search process
+- Monitor progress in real-time
+- Export comprehensive results
+"""
+
+_QUICK_LINKS_MD = """
+---
 
-# Import and initialize configuration
-from chemscreen.config import initialize_config
-from shared.app_utils import init_session_state
+### 🔗 Quick Links
+- [User Guide](https://github.com/clockworkmind/chemscreen-proto/wiki)
+- [Report Issue](https://github.com/clockworkmind/chemscreen-proto/issues)
+- [Demo Data](data/raw/demo_chemicals.csv)
 
-# Import shared utilities
-from shared.ui_utils import load_custom_css, setup_sidebar
+---
+"""
 
-# Initialize configuration system
-config = initialize_config()
+_FEATURES_HEADER_MD = """
+---
+### ✨ What Makes ChemScreen Special
+"""
 
-# Configure logging using config
-logging.basicConfig(
-    level=getattr(logging, config.log_level),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
-logger = logging.getLogger(__name__)
+_SPEED_MD = """
+#### ⚡ Speed & Efficiency
+- Process 100+ chemicals in minutes
+- Parallel API requests with rate limiting
+- Smart caching reduces redundant calls
+- Real-time progress tracking
+"""
 
-# Create required directories
-config.create_directories()
+_QUALITY_MD = """
+#### 📊 Quality Analysis
+- Automated quality scoring
+- Publication trend analysis
+- Review article identification
+- Recency-based prioritization
+"""
 
-# Log configuration warnings if any
-config_warnings = config.validate_configuration()
-if config_warnings:
-    for warning in config_warnings:
-        logger.warning(f"Configuration: {warning}")
+_EXPORT_MD = """
+#### 📤 Export & Integration
+- Multiple export formats (CSV, Excel, JSON)
+- Structured data for analysis
+- Session persistence and history
+- Comprehensive metadata inclusion
+"""
 
-# Page configuration must be the first Streamlit command
-st.set_page_config(
-    page_title=config.page_title,
-    page_icon=config.page_icon,
-    layout="wide",
-    initial_sidebar_state="expanded",
-    menu_items={
-        "Get Help": "https://github.com/clockworkmind/chemscreen-proto",
-        "Report a bug": "https://github.com/clockworkmind/chemscreen-proto/issues",
-        "About": "ChemScreen Prototype v1.0 - Batch Chemical Literature Search Tool",
-    },
-)
 
-# Initialize session state and UI
-init_session_state()
-load_custom_css()
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _get_logger(log_level: str) -> logging.Logger:
+    """Configure logging once per process and return the application logger.
+
+    Args:
+        log_level: Logging level name from the configuration
+
+    Returns:
+        Logger for the entrypoint
+    """
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=getattr(logging, log_level),
+            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        )
+    return logging.getLogger(__name__)
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _load_config() -> "Config":
+    """Initialize configuration once per process.
+
+    The result is shared across reruns and sessions, so the environment is
+    only read the first time the app is loaded rather than on every rerun.
+
+    Returns:
+        Config instance
+    """
+    from chemscreen.config import initialize_config
+
+    config = initialize_config()
+
+    # Configure logging before anything else is logged
+    _get_logger(config.log_level)
+    return config
+
+
+@st.cache_resource(show_spinner=False, max_entries=1, ttl=_CONFIG_WARNINGS_TTL)
+def _config_warnings(_config: "Config") -> list[str]:
+    """Validate the configuration and log any warnings.
+
+    Cached with a TTL so that validation (which also creates the required
+    directories) runs at most once per interval instead of on every rerun,
+    and the warnings are only logged when they are recomputed.
 
-setup_sidebar()
+    Args:
+        _config: Configuration to validate (not hashed)
+
+    Returns:
+        List of configuration warnings
+    """
+    logger = _get_logger(_config.log_level)
+    config_warnings = _config.validate_configuration()
+    for warning in config_warnings:
+        logger.warning(f"Configuration: {warning}")
+    return config_warnings
+
+
+def _bootstrap() -> None:
+    """Load configuration and set up the page before any content is rendered.
+
+    Imports are kept local so that the module itself stays cheap to execute on
+    every Streamlit rerun.
+    """
+    from shared.session_init import init_session_state
+    from shared.ui_utils import load_custom_css, setup_sidebar
+
+    config = _load_config()
+    _config_warnings(config)
+
+    # Page configuration must be the first Streamlit command
+    st.set_page_config(
+        page_title=config.page_title,
+        page_icon=config.page_icon,
+        layout="wide",
+        initial_sidebar_state="expanded",
+        menu_items=_MENU_ITEMS,
+    )
+
+    # Initialize session state and UI
+    init_session_state()
+    load_custom_css()
+
+    setup_sidebar()
+
+
+@st.fragment(run_every=_STATS_REFRESH_INTERVAL)
+def _session_stats() -> None:
+    """Display live session statistics.
+
+    Runs as a fragment on a timer so the metrics refresh without rerunning
+    the rest of the home page.
+    """
+    st.markdown("### 📈 Session Stats")
+
+    # Counters are maintained in session state whenever the underlying lists change
+    ss = st.session_state
+    chemicals_count = ss.get("chemicals_count", 0)
+    results_count = ss.get("total_results", 0)
+
+    # Estimate time saved (rough calculation: 2-3 minutes per chemical manually vs seconds with tool)
+    time_saved_hours = chemicals_count * _HOURS_PER_CHEMICAL
+
+    # Success rate calculation
+    success_rate = (
+        100 * ss.get("successful_count", 0) / results_count if results_count else 0
+    )
+
+    st.metric(
+        "Chemicals Loaded",
+        chemicals_count,
+        help="Total chemicals loaded in current session",
+    )
+    st.metric(
+        "Search Results",
+        results_count,
+        help="Number of completed searches in current session",
+    )
+    st.metric(
+        "Estimated Time Saved",
+        f"{time_saved_hours:.1f} hours",
+        help="Estimated time saved vs manual searching",
+    )
+    st.metric(
+        "Success Rate",
+        f"{success_rate:.0f}%",
+        help="Percentage of successful searches",
+    )
 
 
 def show_home_page() -> None:
     """Display the home/welcome page."""
     st.title("🧪 ChemScreen - Chemical Literature Search Tool")
 
-    col1, col2 = st.columns([2, 1])
+    col1, col2 = st.columns(_HOME_COLUMN_RATIOS)
 
     with col1:
-        st.markdown("""
-        ### Welcome to ChemScreen
-
-        ChemScreen is a specialized tool designed for librarians supporting regulatory chemical risk assessments.
-        It enables batch processing of chemical literature searches, reducing screening time from days to hours.
-
-        #### 🎯 Key Features:
-        - **Batch Processing**: Search 100+ chemicals simultaneously
-        - **Quality Scoring**: Automated literature quality assessment
-        - **Smart Caching**: Avoid redundant API calls
-        - **Export Options**: CSV and Excel formats
-        - **Progress Tracking**: Real-time search status
-
-        #### 🚀 Getting Started:
-        1. **Upload** your chemical list (CSV format)
-        2. **Configure** search parameters
-        3. **Run** the batch search
-        4. **Export** results for analysis
-
-        #### 📊 Typical Workflow:
-        - Upload a CSV with chemical names or CAS numbers
-        - Review and validate the chemical list
-        - Start the batch search process
-        - Monitor progress in real-time
-        - Export comprehensive results
-        """)
+        st.markdown(_WELCOME_MD)
 
         st.info(
             "💡 **Tip**: Start with the demo dataset to familiarize yourself with the tool's capabilities."
@@ -103,11 +265,14 @@ def show_home_page() -> None:
         # Quick start buttons
         st.markdown("### 🚀 Quick Start")
 
-        col1a, col1b, col1c = st.columns(3)
+        col1a, col1b, col1c = st.columns(_QUICK_START_COLUMNS)
 
         with col1a:
-            if st.button("📤 Upload Chemicals", type="primary", use_container_width=True):
-                st.switch_page("pages/1_📤_Upload_Chemicals.py")
+            st.page_link(
+                "pages/1_📤_Upload_Chemicals.py",
+                label="📤 Upload Chemicals",
+                use_container_width=True,
+            )
 
         with col1b:
             if st.button("📊 Load Demo Data", use_container_width=True):
@@ -116,117 +281,60 @@ def show_home_page() -> None:
                 load_demo_data("medium")
 
         with col1c:
-            if st.button("📜 View History", use_container_width=True):
-                st.switch_page("pages/5_📜_History.py")
-
-    with col2:
-        st.markdown("### 📈 Session Stats")
-
-        # Calculate real-time stats
-        chemicals_count = (
-            len(st.session_state.chemicals) if st.session_state.chemicals else 0
-        )
-        results_count = (
-            len(st.session_state.search_results) if st.session_state.search_results else 0
-        )
-
-        # Estimate time saved (rough calculation: 2-3 minutes per chemical manually vs seconds with tool)
-        time_saved_hours = chemicals_count * 2.5 / 60 if chemicals_count > 0 else 0
-
-        # Success rate calculation
-        if st.session_state.search_results:
-            successful_searches = len(
-                [r for r in st.session_state.search_results if not r.error]
+            st.page_link(
+                "pages/5_📜_History.py",
+                label="📜 View History",
+                use_container_width=True,
             )
-            success_rate = (
-                successful_searches / len(st.session_state.search_results)
-            ) * 100
-        else:
-            success_rate = 0
 
-        st.metric(
-            "Chemicals Loaded",
-            chemicals_count,
-            help="Total chemicals loaded in current session",
-        )
-        st.metric(
-            "Search Results",
-            results_count,
-            help="Number of completed searches in current session",
-        )
-        st.metric(
-            "Estimated Time Saved",
-            f"{time_saved_hours:.1f} hours",
-            help="Estimated time saved vs manual searching",
-        )
-        st.metric(
-            "Success Rate",
-            f"{success_rate:.0f}%",
-            help="Percentage of successful searches",
-        )
-
-        st.markdown("---")
-
-        st.markdown("### 🔗 Quick Links")
-        st.markdown(
-            "- [User Guide](https://github.com/clockworkmind/chemscreen-proto/wiki)"
-        )
-        st.markdown(
-            "- [Report Issue](https://github.com/clockworkmind/chemscreen-proto/issues)"
-        )
-        st.markdown("- [Demo Data](data/raw/demo_chemicals.csv)")
+    with col2:
+        _session_stats()
 
-        st.markdown("---")
+        st.markdown(_QUICK_LINKS_MD)
 
         # Current session info
+        ss = st.session_state
+        chemicals_count = ss.get("chemicals_count", 0)
+        results_count = ss.get("total_results", 0)
+        current_batch_id = ss.get("current_batch_id")
+
         st.markdown("### 📋 Current Session")
-        if st.session_state.current_batch_id:
-            st.success(f"Active Batch: {st.session_state.current_batch_id}")
+        if current_batch_id:
+            st.success(_ACTIVE_BATCH_MSG.format(current_batch_id))
         else:
-            st.info("No active search session")
+            st.info(_NO_SESSION_MSG)
 
         # Quick status
         if chemicals_count > 0:
-            st.success(f"✅ {chemicals_count} chemicals ready")
+            st.success(_CHEMICALS_READY_MSG.format(chemicals_count))
         else:
-            st.warning("⚠️ No chemicals loaded")
+            st.warning(_NO_CHEMICALS_MSG)
 
         if results_count > 0:
-            st.success(f"📊 {results_count} results available")
+            st.success(_RESULTS_AVAILABLE_MSG.format(results_count))
 
     # Feature highlights
-    st.markdown("---")
-    st.markdown("### ✨ What Makes ChemScreen Special")
+    st.markdown(_FEATURES_HEADER_MD)
 
-    feature_col1, feature_col2, feature_col3 = st.columns(3)
+    feature_col1, feature_col2, feature_col3 = st.columns(_FEATURE_COLUMNS)
 
     with feature_col1:
-        st.markdown("""
-        #### ⚡ Speed & Efficiency
-        - Process 100+ chemicals in minutes
-        - Parallel API requests with rate limiting
-        - Smart caching reduces redundant calls
-        - Real-time progress tracking
-        """)
+        st.markdown(_SPEED_MD)
 
     with feature_col2:
-        st.markdown("""
-        #### 📊 Quality Analysis
-        - Automated quality scoring
-        - Publication trend analysis
-        - Review article identification
-        - Recency-based prioritization
-        """)
+        st.markdown(_QUALITY_MD)
 
     with feature_col3:
-        st.markdown("""
-        #### 📤 Export & Integration
-        - Multiple export formats (CSV, Excel, JSON)
-        - Structured data for analysis
-        - Session persistence and history
-        - Comprehensive metadata inclusion
-        """)
+        st.markdown(_EXPORT_MD)
 
 
 # Main execution
-show_home_page()
+_bootstrap()
+
+navigation = st.navigation(
+    [
+        st.Page(show_home_page, title="ChemScreen", icon="🧪", default=True),
+        *(st.Page(path, title=title, icon=icon) for path, title, icon in _PAGES),
+    ]
+)
+navigation.run()
@@ -1,8 +1,24 @@
 """ChemScreen - Chemical literature screening tool."""
 
+import importlib
+from types import ModuleType
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 __author__ = "ChemScreen Team"
 
-from . import analyzer, cache, exporter, models, processor, pubmed
-
 __all__ = ["analyzer", "cache", "exporter", "models", "processor", "pubmed"]
+
+if TYPE_CHECKING:
+    from . import analyzer, cache, exporter, models, processor, pubmed
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import submodules on first access.
+
+    Importing a lightweight submodule such as chemscreen.config should not pull
+    in pandas, aiohttp and openpyxl through the heavier ones.
+    """
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
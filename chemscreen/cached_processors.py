@@ -1,35 +1,104 @@
 """Cached versions of processor functions for performance optimization."""
 
+from collections.abc import Hashable
+from io import BytesIO
+from typing import TYPE_CHECKING, Optional
+
 import pandas as pd
 import streamlit as st
 
 from chemscreen import processor
 from chemscreen.models import CSVColumnMapping, CSVUploadResult
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# Bounds for the per-upload caches: a handful of recent files per process,
+# evicted after an hour so long-running servers don't accumulate old uploads
+_UPLOAD_CACHE_MAX_ENTRIES = 16
+_UPLOAD_CACHE_TTL = 3600  # seconds
 
-@st.cache_data(show_spinner=False)
+
+@st.cache_data(
+    show_spinner=False,
+    max_entries=_UPLOAD_CACHE_MAX_ENTRIES,
+    ttl=_UPLOAD_CACHE_TTL,
+    # Older Streamlit releases cannot hash pydantic models; hash the fields
+    hash_funcs={CSVColumnMapping: lambda mapping: mapping.model_dump_json()},
+)
 def cached_process_csv_data(
     df: pd.DataFrame,
-    _column_mapping: CSVColumnMapping,
+    column_mapping: CSVColumnMapping,
 ) -> CSVUploadResult:
     """
     Cached version of process_csv_data for better performance with large datasets.
 
     This function is cached by Streamlit to avoid reprocessing the same data.
-    The underscore prefix on _column_mapping tells Streamlit not to hash this parameter.
+    The column mapping is part of the cache key, so choosing different columns
+    for the same file reprocesses it instead of returning stale results.
+    """
+    return processor.process_csv_data(df, column_mapping)
+
+
+@st.cache_data(
+    show_spinner=False, max_entries=_UPLOAD_CACHE_MAX_ENTRIES, ttl=_UPLOAD_CACHE_TTL
+)
+def cached_read_csv_limited(
+    file_bytes: bytes, max_rows: int, count_all: bool = True
+) -> tuple[pd.DataFrame, int]:
+    """
+    Cached version of read_csv_limited keyed on the uploaded file contents.
+
+    Reruns triggered by widget interactions reuse the parsed frame instead of
+    parsing the upload again.
     """
-    return processor.process_csv_data(df, _column_mapping)
+    return processor.read_csv_limited(BytesIO(file_bytes), max_rows, count_all=count_all)
 
 
-@st.cache_data(show_spinner=False)
-def cached_suggest_column_mapping(df: pd.DataFrame) -> CSVColumnMapping:
+@st.cache_resource(
+    show_spinner=False, max_entries=_UPLOAD_CACHE_MAX_ENTRIES, ttl=_UPLOAD_CACHE_TTL
+)
+def cached_preview_table(upload_key: Hashable, _df: pd.DataFrame) -> "pa.Table":
+    """
+    Arrow table of the parsed upload for previews, converted once per file.
+
+    Slices of the table can be passed straight to st.dataframe, so paging
+    through the preview does not convert a pandas frame to Arrow on every
+    rerun. Columns that mostly repeat a few values (categories, notes) are
+    dictionary-encoded so each page ships fewer bytes to the browser.
+    Arrow tables are immutable, so a shared resource is safe. The frame is
+    not hashed; upload_key must identify the upload it came from.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    table = pa.Table.from_pandas(_df, preserve_index=False)
+    for i, column in enumerate(table.columns):
+        if pa.types.is_string(column.type) and (
+            pc.count_distinct(column).as_py() * 2 <= table.num_rows
+        ):
+            table = table.set_column(i, table.field(i).name, column.dictionary_encode())
+    return table
+
+
+@st.cache_data(
+    show_spinner=False, max_entries=_UPLOAD_CACHE_MAX_ENTRIES, ttl=_UPLOAD_CACHE_TTL
+)
+def cached_suggest_column_mapping(
+    columns: tuple[str, ...],
+) -> Optional[CSVColumnMapping]:
     """
     Cached version of suggest_column_mapping to avoid recalculating suggestions.
+
+    Keyed on the column names only, since the suggestions never look at the
+    data; hashing a tuple of names is much cheaper than hashing the frame.
     """
-    return processor.suggest_column_mapping(df)
+    return processor.suggest_column_mapping_from_columns(columns)
 
 
-@st.cache_data(show_spinner=False)
+@st.cache_data(
+    show_spinner=False, max_entries=_UPLOAD_CACHE_MAX_ENTRIES, ttl=_UPLOAD_CACHE_TTL
+)
 def cached_validate_csv_file(
     file_content: str, delimiter: str = ",", encoding: str = "utf-8"
 ) -> tuple[bool, pd.DataFrame | None, str | None]:
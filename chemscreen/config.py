@@ -81,7 +81,7 @@ class Config:
 
         # Performance Configuration
         self.memory_limit_mb = int(os.getenv("MEMORY_LIMIT_MB", "512"))
-        self.concurrent_requests = int(os.getenv("CONCURRENT_REQUESTS", "1"))
+        self.concurrent_requests = int(os.getenv("CONCURRENT_REQUESTS", "3"))
 
         # Development/Debug
         self.debug_mode = os.getenv("DEBUG_MODE", "false").lower() == "true"
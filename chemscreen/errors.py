@@ -191,14 +191,39 @@ def show_error_with_help(
 
     # Show detailed suggestions
     with st.expander("💡 How to Fix This", expanded=expand_help):
-        for suggestion in error_info["suggestions"]:
-            st.markdown(f"• {suggestion}")
+        st.markdown(
+            "  \n".join(f"• {suggestion}" for suggestion in error_info["suggestions"])
+        )
 
         if "details" in error_info:
             st.markdown("---")
             st.caption(f"Technical details: {error_info['details']}")
 
 
+# Fix-up advice per validation error type, in display order. Lines end with
+# two spaces so each bullet renders on its own line within one markdown block.
+_VALIDATION_HELP = {
+    "cas": (
+        "**CAS Number Issues:**  \n"
+        "• Use format XXX-XX-X (e.g., 75-09-2)  \n"
+        "• Check for typos or missing digits  \n"
+        "• Leave blank if CAS number is unknown"
+    ),
+    "empty": (
+        "**Missing Information:**  \n"
+        "• Each row needs either a chemical name or CAS number  \n"
+        "• Remove completely empty rows  \n"
+        "• Check for extra commas or formatting issues"
+    ),
+    "invalid": (
+        "**Data Format Issues:**  \n"
+        "• Remove special characters from chemical names  \n"
+        "• Use standard chemical nomenclature when possible  \n"
+        "• Check for encoding issues (use UTF-8)"
+    ),
+}
+
+
 def show_validation_help(
     validation_errors: list[dict[str, Any]], expand: bool = True
 ) -> None:
@@ -212,36 +237,33 @@ def show_validation_help(
     if not validation_errors:
         return
 
+    # Flatten every row's error details into one list of messages up front
+    # (row records hold a list of {"field", "message"} dicts under "errors")
+    messages = []
+    for error in validation_errors:
+        details = error.get("errors", str(error))
+        if isinstance(details, str):
+            messages.append(details)
+        else:
+            messages.extend(str(detail.get("message", "")) for detail in details)
+
+    error_types = set()
+    for message in messages:
+        message_lower = message.lower()
+        if "CAS" in message:
+            error_types.add("cas")
+        elif "empty" in message_lower or "missing" in message_lower:
+            error_types.add("empty")
+        elif "invalid" in message_lower:
+            error_types.add("invalid")
+
+    # One markdown element for all applicable sections instead of one per line
+    sections = [
+        help_text for key, help_text in _VALIDATION_HELP.items() if key in error_types
+    ]
     with st.expander("❓ How to Fix Validation Errors", expanded=expand):
-        error_types = set()
-        for error in validation_errors:
-            error_msg = error.get("errors", str(error))
-            if "CAS" in error_msg:
-                error_types.add("cas")
-            elif "empty" in error_msg.lower() or "missing" in error_msg.lower():
-                error_types.add("empty")
-            elif "invalid" in error_msg.lower():
-                error_types.add("invalid")
-
-        if "cas" in error_types:
-            st.markdown("**CAS Number Issues:**")
-            st.markdown("• Use format XXX-XX-X (e.g., 75-09-2)")
-            st.markdown("• Check for typos or missing digits")
-            st.markdown("• Leave blank if CAS number is unknown")
-            st.markdown("")
-
-        if "empty" in error_types:
-            st.markdown("**Missing Information:**")
-            st.markdown("• Each row needs either a chemical name or CAS number")
-            st.markdown("• Remove completely empty rows")
-            st.markdown("• Check for extra commas or formatting issues")
-            st.markdown("")
-
-        if "invalid" in error_types:
-            st.markdown("**Data Format Issues:**")
-            st.markdown("• Remove special characters from chemical names")
-            st.markdown("• Use standard chemical nomenclature when possible")
-            st.markdown("• Check for encoding issues (use UTF-8)")
+        if sections:
+            st.markdown("\n\n".join(sections))
 
 
 def log_error_for_support(error: Exception, context: str | None = None) -> None:
@@ -1,28 +1,23 @@
 """Export functionality for search results."""
 
 import csv
+import importlib.util
 import json
 import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
-try:
-    import openpyxl
-    from openpyxl.styles import Alignment, Font, PatternFill
-    from openpyxl.utils import get_column_letter
-
-    EXCEL_AVAILABLE = True
-except ImportError:
-    EXCEL_AVAILABLE = False
-    logger = logging.getLogger(__name__)
-    logger.warning("openpyxl not available, Excel export disabled")
-
 from chemscreen.config import Config, get_config
 from chemscreen.models import BatchSearchSession, QualityMetrics, SearchResult
 
 logger = logging.getLogger(__name__)
 
+# openpyxl is only imported when an Excel export is actually generated
+EXCEL_AVAILABLE = importlib.util.find_spec("openpyxl") is not None
+if not EXCEL_AVAILABLE:
+    logger.warning("openpyxl not available, Excel export disabled")
+
 
 class ExportManager:
     """Manages export of search results to various formats."""
@@ -83,39 +78,43 @@ class ExportManager:
             if include_abstracts:
                 fields.extend(["PMID", "Title", "Authors", "Journal", "Year", "Abstract"])
 
-            writer = csv.DictWriter(f, fieldnames=fields)
-            writer.writeheader()
+            # Rows are written as plain lists in field order, avoiding a dict
+            # per row and DictWriter's per-row key lookups
+            writer = csv.writer(f)
+            writer.writerow(fields)
 
             # Write data
             for result, metrics in results:
-                base_row = {
-                    "Chemical Name": result.chemical.name,
-                    "CAS Number": result.chemical.cas_number or "",
-                    "Total Publications": metrics.total_publications,
-                    "Review Articles": metrics.review_count,
-                    "Recent Publications (3yr)": metrics.recent_publications,
-                    "Quality Score": metrics.quality_score,
-                    "Publication Trend": metrics.publication_trend,
-                    "Has Recent Review": "Yes" if metrics.has_recent_review else "No",
-                    "Search Status": "Failed" if result.error else "Success",
-                    "Error Message": result.error or "",
-                }
+                base_row = [
+                    result.chemical.name,
+                    result.chemical.cas_number or "",
+                    metrics.total_publications,
+                    metrics.review_count,
+                    metrics.recent_publications,
+                    metrics.quality_score,
+                    metrics.publication_trend,
+                    "Yes" if metrics.has_recent_review else "No",
+                    "Failed" if result.error else "Success",
+                    result.error or "",
+                ]
 
                 if include_abstracts and result.publications:
                     # Write one row per publication
-                    for pub in result.publications:
-                        row = base_row.copy()
-                        row.update(
-                            {
-                                "PMID": pub.pmid,
-                                "Title": pub.title,
-                                "Authors": "; ".join(pub.authors),
-                                "Journal": pub.journal or "",
-                                "Year": pub.year or "",
-                                "Abstract": pub.abstract or "",
-                            }
-                        )
-                        writer.writerow(row)
+                    writer.writerows(
+                        [
+                            *base_row,
+                            pub.pmid,
+                            pub.title,
+                            "; ".join(pub.authors),
+                            pub.journal or "",
+                            pub.year or "",
+                            pub.abstract or "",
+                        ]
+                        for pub in result.publications
+                    )
+                elif include_abstracts:
+                    # Summary row only, padded to the publication columns
+                    writer.writerow(base_row + [""] * 6)
                 else:
                     # Write summary row only
                     writer.writerow(base_row)
@@ -151,12 +150,11 @@ class ExportManager:
 
         filepath = self.export_dir / filename
 
-        # Create workbook
-        wb = openpyxl.Workbook()
+        import openpyxl
 
-        # Remove default sheet
-        if wb.active is not None:
-            wb.remove(wb.active)
+        # Write-only workbook: rows are serialized as they are appended
+        # instead of every cell being kept in memory until the save
+        wb = openpyxl.Workbook(write_only=True)
 
         # Create sheets
         self._create_summary_sheet(wb, results, session)
@@ -176,6 +174,10 @@ class ExportManager:
         session: BatchSearchSession,
     ) -> None:
         """Create summary sheet in Excel workbook."""
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Alignment, Font, PatternFill
+        from openpyxl.utils import get_column_letter
+
         ws = wb.create_sheet("Summary")
 
         # Headers
@@ -190,45 +192,58 @@ class ExportManager:
             "Priority",
         ]
 
+        # Column widths must be set before any rows are written
+        for col in range(1, len(headers) + 1):
+            ws.column_dimensions[get_column_letter(col)].width = 15
+
         # Style headers
         header_font = Font(bold=True, color="FFFFFF")
         header_fill = PatternFill(
             start_color="0066CC", end_color="0066CC", fill_type="solid"
         )
+        header_alignment = Alignment(horizontal="center")
 
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
             cell.font = header_font
             cell.fill = header_fill
-            cell.alignment = Alignment(horizontal="center")
+            cell.alignment = header_alignment
+            header_cells.append(cell)
+        ws.append(header_cells)
+
+        # Priority label and colour by quality score
+        priority_fonts = {
+            "High": Font(color="00AA00", bold=True),  # Green
+            "Medium": Font(color="FFA500", bold=True),  # Orange
+            "Low": Font(color="FF0000", bold=True),  # Red
+        }
 
         # Write data
-        for row, (result, metrics) in enumerate(results, 2):
-            ws.cell(row=row, column=1, value=result.chemical.name)
-            ws.cell(row=row, column=2, value=result.chemical.cas_number or "")
-            ws.cell(row=row, column=3, value=metrics.total_publications)
-            ws.cell(row=row, column=4, value=metrics.review_count)
-            ws.cell(row=row, column=5, value=metrics.recent_publications)
-            ws.cell(row=row, column=6, value=metrics.quality_score)
-            ws.cell(row=row, column=7, value=metrics.publication_trend)
-
+        for result, metrics in results:
             # Priority based on quality score
             if metrics.quality_score >= 70:
                 priority = "High"
-                color = "00AA00"  # Green
             elif metrics.quality_score >= 40:
                 priority = "Medium"
-                color = "FFA500"  # Orange
             else:
                 priority = "Low"
-                color = "FF0000"  # Red
 
-            priority_cell = ws.cell(row=row, column=8, value=priority)
-            priority_cell.font = Font(color=color, bold=True)
-
-        # Auto-adjust column widths
-        for col in range(1, len(headers) + 1):
-            ws.column_dimensions[get_column_letter(col)].width = 15
+            priority_cell = WriteOnlyCell(ws, value=priority)
+            priority_cell.font = priority_fonts[priority]
+
+            ws.append(
+                [
+                    result.chemical.name,
+                    result.chemical.cas_number or "",
+                    metrics.total_publications,
+                    metrics.review_count,
+                    metrics.recent_publications,
+                    metrics.quality_score,
+                    metrics.publication_trend,
+                    priority_cell,
+                ]
+            )
 
     def _create_detailed_sheet(
         self,
@@ -237,6 +252,9 @@ class ExportManager:
         include_abstracts: bool,
     ) -> None:
         """Create detailed results sheet in Excel workbook."""
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font
+
         ws = wb.create_sheet("Detailed Results")
 
         # Headers
@@ -257,52 +275,54 @@ class ExportManager:
         # Style headers
         header_font = Font(bold=True)
 
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
             cell.font = header_font
+            header_cells.append(cell)
+        ws.append(header_cells)
 
         # Write data
-        row_num = 2
         for result, metrics in results:
             if result.publications:
                 for pub in result.publications:
-                    ws.cell(row=row_num, column=1, value=result.chemical.name)
-                    ws.cell(row=row_num, column=2, value=result.chemical.cas_number or "")
-                    ws.cell(row=row_num, column=3, value=pub.pmid)
-                    ws.cell(row=row_num, column=4, value=pub.title)
-                    ws.cell(
-                        row=row_num,
-                        column=5,
-                        value="; ".join(pub.authors[:3])
+                    row = [
+                        result.chemical.name,
+                        result.chemical.cas_number or "",
+                        pub.pmid,
+                        pub.title,
+                        "; ".join(pub.authors[:3])
                         + ("..." if len(pub.authors) > 3 else ""),
-                    )
-                    ws.cell(row=row_num, column=6, value=pub.journal or "")
-                    ws.cell(row=row_num, column=7, value=pub.year or "")
-                    ws.cell(
-                        row=row_num,
-                        column=8,
-                        value="Review" if pub.is_review else "Research",
-                    )
+                        pub.journal or "",
+                        pub.year or "",
+                        "Review" if pub.is_review else "Research",
+                    ]
 
                     if include_abstracts:
-                        ws.cell(row=row_num, column=9, value=pub.abstract or "")
+                        row.append(pub.abstract or "")
 
-                    row_num += 1
+                    ws.append(row)
             else:
                 # Chemical with no results
-                ws.cell(row=row_num, column=1, value=result.chemical.name)
-                ws.cell(row=row_num, column=2, value=result.chemical.cas_number or "")
-                ws.cell(
-                    row=row_num,
-                    column=3,
-                    value="No results" if not result.error else f"Error: {result.error}",
+                ws.append(
+                    [
+                        result.chemical.name,
+                        result.chemical.cas_number or "",
+                        "No results" if not result.error else f"Error: {result.error}",
+                    ]
                 )
-                row_num += 1
 
     def _create_metadata_sheet(self, wb: Any, session: BatchSearchSession) -> None:
         """Create metadata sheet in Excel workbook."""
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font
+
         ws = wb.create_sheet("Search Metadata")
 
+        # Auto-adjust column widths
+        ws.column_dimensions["A"].width = 25
+        ws.column_dimensions["B"].width = 30
+
         # Write metadata
         metadata = [
             ("Batch ID", session.batch_id),
@@ -315,13 +335,11 @@ class ExportManager:
             ("Export Generated", datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
         ]
 
-        for row, (label, value) in enumerate(metadata, 1):
-            ws.cell(row=row, column=1, value=label).font = Font(bold=True)
-            ws.cell(row=row, column=2, value=str(value))
-
-        # Auto-adjust column widths
-        ws.column_dimensions["A"].width = 25
-        ws.column_dimensions["B"].width = 30
+        label_font = Font(bold=True)
+        for label, value in metadata:
+            label_cell = WriteOnlyCell(ws, value=label)
+            label_cell.font = label_font
+            ws.append([label_cell, str(value)])
 
     def export_to_json(
         self,
@@ -6,6 +6,9 @@ from typing import Any, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+# CAS Registry Number format: XXXXXXX-XX-X (2-7 digits, 2 digits, check digit)
+CAS_NUMBER_PATTERN = re.compile(r"^\d{2,7}-\d{2}-\d$")
+
 
 def get_default_max_results() -> int:
     """Get default max results from config, with fallback to 100."""
@@ -39,8 +42,7 @@ class Chemical(BaseModel):
         v = v.strip()
 
         # Basic CAS format check: XXXXXX-XX-X where X is a digit
-        cas_pattern = re.compile(r"^\d{2,7}-\d{2}-\d$")
-        if not cas_pattern.match(v):
+        if not CAS_NUMBER_PATTERN.match(v):
             raise ValueError(
                 f"Invalid CAS number format: {v}. Expected format: XXXXXX-XX-X"
             )
@@ -186,6 +188,10 @@ class CSVUploadResult(BaseModel):
     column_mapping: dict[str, str] = Field(
         default_factory=dict, description="Mapping of CSV columns to fields"
     )
+    duplicates: list[tuple[int, int]] = Field(
+        default_factory=list,
+        description="Index pairs (first, duplicate) into valid_chemicals",
+    )
 
     @property
     def success_rate(self) -> float:
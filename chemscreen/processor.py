@@ -2,16 +2,25 @@
 
 import logging
 import re
+from collections.abc import Iterable
 from io import StringIO
-from typing import Any, Optional
+from typing import IO, Any, Optional, Union
 
 import pandas as pd
 from pydantic import ValidationError
 
-from chemscreen.models import Chemical, CSVColumnMapping, CSVUploadResult
+from chemscreen.models import (
+    CAS_NUMBER_PATTERN,
+    Chemical,
+    CSVColumnMapping,
+    CSVUploadResult,
+)
 
 logger = logging.getLogger(__name__)
 
+# Delimiters accepted between synonyms in a single CSV cell
+_SYNONYM_SEPARATOR_RE = re.compile(r"[;,|]")
+
 
 def validate_cas_number(cas: str) -> bool:
     """
@@ -30,8 +39,7 @@ def validate_cas_number(cas: str) -> bool:
     cas = cas.strip().replace(" ", "")
 
     # Check format
-    pattern = r"^\d{2,7}-\d{2}-\d$"
-    if not re.match(pattern, cas):
+    if not CAS_NUMBER_PATTERN.match(cas):
         return False
 
     # Extract digits for checksum validation
@@ -152,55 +160,68 @@ def detect_duplicates(chemicals: list[Chemical]) -> list[tuple[int, int]]:
     Returns:
         List of tuples with duplicate indices
     """
-    if not chemicals:
+    # A single chemical (or none) cannot have a duplicate
+    if len(chemicals) < 2:
         return []
 
-    # Convert to DataFrame for vectorized operations
-    data = []
-    for i, chem in enumerate(chemicals):
-        data.append(
-            {
-                "index": i,
-                "name_lower": chem.name.lower() if chem.name else "",
-                "cas_number": chem.cas_number or "",
-            }
-        )
-
-    df = pd.DataFrame(data)
-    duplicates = []
+    # Fast path: with no repeated CAS number or name there is nothing to pair up,
+    # so skip building the DataFrame (the common case for curated lists)
+    cas_numbers = [chem.cas_number for chem in chemicals if chem.cas_number]
+    names = [chem.name.lower() for chem in chemicals if chem.name]
+    if len(set(cas_numbers)) == len(cas_numbers) and len(set(names)) == len(names):
+        return []
 
-    # Find CAS duplicates (more reliable)
-    cas_df = df[df["cas_number"] != ""]
-    if not cas_df.empty:
-        cas_dups = cas_df[cas_df.duplicated(subset=["cas_number"], keep="first")]
-        for _, dup_row in cas_dups.iterrows():
-            first_idx = df[df["cas_number"] == dup_row["cas_number"]].iloc[0]["index"]
-            duplicates.append((int(first_idx), int(dup_row["index"])))
+    # Convert to DataFrame for vectorized operations (the index is the position)
+    df = pd.DataFrame(
+        {
+            "name_lower": [chem.name.lower() if chem.name else "" for chem in chemicals],
+            "cas_number": [chem.cas_number or "" for chem in chemicals],
+        }
+    )
+    positions = df.index.to_series()
+
+    # Find CAS duplicates (more reliable), paired with the first row sharing the CAS
+    cas_dup_mask = (df["cas_number"] != "") & df["cas_number"].duplicated()
+    first_by_cas = positions.groupby(df["cas_number"]).transform("first")
+    duplicates = list(
+        zip(
+            first_by_cas[cas_dup_mask].astype(int).tolist(),
+            positions[cas_dup_mask].astype(int).tolist(),
+        )
+    )
 
     # Find name duplicates (excluding already found CAS duplicates)
-    already_found = {dup[1] for dup in duplicates}
-    name_df = df[~df["index"].isin(already_found) & (df["name_lower"] != "")]
-    if not name_df.empty:
-        name_dups = name_df[name_df.duplicated(subset=["name_lower"], keep="first")]
-        for _, dup_row in name_dups.iterrows():
-            first_idx = df[df["name_lower"] == dup_row["name_lower"]].iloc[0]["index"]
-            duplicates.append((int(first_idx), int(dup_row["index"])))
+    name_mask = ~cas_dup_mask & (df["name_lower"] != "")
+    name_dup_mask = name_mask & df["name_lower"].where(name_mask).duplicated()
+    first_by_name = positions.groupby(df["name_lower"]).transform("first")
+    duplicates.extend(
+        zip(
+            first_by_name[name_dup_mask].astype(int).tolist(),
+            positions[name_dup_mask].astype(int).tolist(),
+        )
+    )
 
     return duplicates
 
 
-def merge_duplicates(chemicals: list[Chemical]) -> list[Chemical]:
+def merge_duplicates(
+    chemicals: list[Chemical],
+    duplicates: Optional[list[tuple[int, int]]] = None,
+) -> list[Chemical]:
     """
     Merge duplicate chemicals, preserving all information.
 
     Args:
         chemicals: List of Chemical objects
+        duplicates: Previously detected duplicate index pairs for chemicals;
+            detected here if not provided
 
     Returns:
         list[Chemical]: Deduplicated list
     """
     # Find duplicates
-    duplicates = detect_duplicates(chemicals)
+    if duplicates is None:
+        duplicates = detect_duplicates(chemicals)
 
     if not duplicates:
         return chemicals
@@ -304,7 +325,7 @@ def process_csv_data(
                 synonyms = str(row.get(column_mapping.synonyms_column, "")).strip()
                 if synonyms and synonyms.lower() not in ["nan", "none", "null"]:
                     # Split synonyms by common delimiters
-                    syn_list = re.split(r"[;,|]", synonyms)
+                    syn_list = _SYNONYM_SEPARATOR_RE.split(synonyms)
                     chemical_data["synonyms"] = [s.strip() for s in syn_list if s.strip()]
             else:
                 chemical_data["synonyms"] = []
@@ -380,11 +401,11 @@ def process_csv_data(
             result.invalid_rows.append(error_details)
             logger.error(f"Row {row_num} processing error: {e}")
 
-    # Check for duplicates
+    # Check for duplicates (kept on the result so callers don't detect them again)
     if result.valid_chemicals:
-        duplicates = detect_duplicates(result.valid_chemicals)
-        if duplicates:
-            for dup1, dup2 in duplicates:
+        result.duplicates = detect_duplicates(result.valid_chemicals)
+        if result.duplicates:
+            for dup1, dup2 in result.duplicates:
                 chem1 = result.valid_chemicals[dup1]
                 chem2 = result.valid_chemicals[dup2]
                 result.warnings.append(
@@ -435,7 +456,129 @@ def validate_csv_file(
         return False, None, f"Unexpected error reading CSV: {str(e)}"
 
 
-def suggest_column_mapping(df: pd.DataFrame) -> CSVColumnMapping:
+def read_csv_limited(
+    source: Union[str, IO[bytes]],
+    max_rows: int,
+    chunksize: int = 50_000,
+    block_size: int = 1 << 20,
+    count_all: bool = True,
+) -> tuple[pd.DataFrame, int]:
+    """
+    Read at most max_rows rows of a CSV file in chunks.
+
+    Rows beyond the limit are streamed and counted but not kept, so peak
+    memory is bounded by the chunk size rather than the file size. All
+    columns are read as strings (missing values become nulls).
+
+    With count_all=False reading stops at the first chunk that goes past
+    the limit, and the returned count is only a lower bound once it
+    exceeds max_rows. Use it when the exact size of an oversized file is
+    not needed.
+
+    Uses PyArrow's multithreaded streaming CSV reader, and falls back to
+    pandas' chunked reader when the file has rows with missing or extra
+    fields that PyArrow's strict parser rejects.
+    Column names match pandas either way: blank headers become
+    "Unnamed: N" and duplicates get ".1", ".2", ... suffixes.
+
+    Args:
+        source: Path or seekable binary file-like object containing CSV data
+        max_rows: Maximum number of rows to keep
+        chunksize: Number of rows per chunk for the pandas fallback reader
+        block_size: Number of bytes per block for the PyArrow reader
+        count_all: Whether to count rows past the limit exactly
+
+    Returns:
+        Tuple of (dataframe with at most max_rows rows, total row count)
+
+    Raises:
+        pd.errors.EmptyDataError: If the file contains no columns
+    """
+    # Imported here rather than at module level to keep importing the
+    # processor cheap; PyArrow is always installed alongside Streamlit
+    import pyarrow as pa
+
+    try:
+        return _read_csv_limited_arrow(source, max_rows, block_size, count_all)
+    except pa.ArrowInvalid:
+        # Ragged rows: pandas pads missing fields with nulls and tolerates
+        # extra ones, as the uploads have always been read
+        if not isinstance(source, str):
+            source.seek(0)
+        return _read_csv_limited_pandas(source, max_rows, chunksize, count_all)
+
+
+def _read_csv_limited_pandas(
+    source: Union[str, IO[bytes]], max_rows: int, chunksize: int, count_all: bool
+) -> tuple[pd.DataFrame, int]:
+    """Chunked pandas implementation of read_csv_limited."""
+    kept: list[pd.DataFrame] = []
+    kept_rows = 0
+    total_rows = 0
+
+    for chunk in pd.read_csv(source, chunksize=chunksize, dtype=str):
+        total_rows += len(chunk)
+        if kept_rows < max_rows or not kept:
+            chunk = chunk.iloc[: max_rows - kept_rows]
+            kept.append(chunk)
+            kept_rows += len(chunk)
+        if not count_all and total_rows > max_rows:
+            break
+
+    df = pd.concat(kept, ignore_index=True) if len(kept) > 1 else kept[0]
+    return df, total_rows
+
+
+def _read_csv_limited_arrow(
+    source: Union[str, IO[bytes]], max_rows: int, block_size: int, count_all: bool
+) -> tuple[pd.DataFrame, int]:
+    """Streaming PyArrow implementation of read_csv_limited."""
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    read_options = pacsv.ReadOptions(block_size=block_size)
+
+    # Type inference only looks at the first block, so read the header first and
+    # force every column to string to avoid conflicts in later blocks
+    header_names = pacsv.open_csv(source, read_options=read_options).schema.names
+    if not isinstance(source, str):
+        source.seek(0)
+
+    convert_options = pacsv.ConvertOptions(
+        column_types={name: pa.string() for name in header_names},
+        strings_can_be_null=True,
+    )
+    reader = pacsv.open_csv(
+        source, read_options=read_options, convert_options=convert_options
+    )
+
+    batches = []
+    kept_rows = 0
+    total_rows = 0
+
+    for batch in reader:
+        total_rows += batch.num_rows
+        if kept_rows < max_rows:
+            batch = batch.slice(0, max_rows - kept_rows)
+            batches.append(batch)
+            kept_rows += batch.num_rows
+        if not count_all and total_rows > max_rows:
+            break
+
+    table = pa.Table.from_batches(batches, schema=reader.schema)
+
+    if "" in header_names or len(set(header_names)) < len(header_names):
+        # Blank or duplicate headers: let pandas name the columns so they get
+        # the same "Unnamed: N" and ".1" names as with the pandas reader
+        if not isinstance(source, str):
+            source.seek(0)
+        column_names = pd.read_csv(source, nrows=0, dtype=str).columns.tolist()
+        table = table.rename_columns(column_names)
+
+    return table.to_pandas(), total_rows
+
+
+def suggest_column_mapping(df: pd.DataFrame) -> Optional[CSVColumnMapping]:
     """
     Suggest column mapping based on column names.
 
@@ -443,9 +586,26 @@ def suggest_column_mapping(df: pd.DataFrame) -> CSVColumnMapping:
         df: DataFrame with CSV data
 
     Returns:
-        CSVColumnMapping with suggested mappings
+        CSVColumnMapping with suggested mappings, or None if neither a name
+        nor a CAS column is recognised
+    """
+    return suggest_column_mapping_from_columns(df.columns)
+
+
+def suggest_column_mapping_from_columns(
+    columns: Iterable[str],
+) -> Optional[CSVColumnMapping]:
+    """
+    Suggest column mapping from column names alone.
+
+    Args:
+        columns: Column names of the CSV data
+
+    Returns:
+        CSVColumnMapping with suggested mappings, or None if neither a name
+        nor a CAS column is recognised (a mapping needs one of them)
     """
-    columns_lower = {col.lower(): col for col in df.columns}
+    columns_lower = {col.lower(): col for col in columns}
 
     # Try to find name column
     name_column = None
@@ -475,6 +635,10 @@ def suggest_column_mapping(df: pd.DataFrame) -> CSVColumnMapping:
             notes_column = columns_lower[pattern]
             break
 
+    # Nothing to identify the chemicals by: no suggestion, the user picks
+    if name_column is None and cas_column is None:
+        return None
+
     return CSVColumnMapping(
         name_column=name_column,
         cas_column=cas_column,
@@ -9,6 +9,7 @@ from xml.etree.ElementTree import Element  # For type hints only
 import aiohttp
 from defusedxml import ElementTree as ET
 
+from chemscreen.cache import CacheManager
 from chemscreen.config import Config, get_config
 from chemscreen.models import Chemical, Publication, SearchResult
 
@@ -44,9 +45,15 @@ class RateLimiter:
 class PubMedClient:
     """Async client for PubMed E-utilities API."""
 
-    def __init__(self, api_key: Optional[str] = None, config: Optional[Config] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        config: Optional[Config] = None,
+        max_concurrent: Optional[int] = None,
+    ):
         self.config = config or get_config()
         self.api_key = api_key or self.config.pubmed_api_key
+        self.max_concurrent = max(max_concurrent or self.config.concurrent_requests, 1)
         self.rate_limit = self.config.get_api_rate_limit()
         self.rate_limiter = RateLimiter(self.rate_limit)
         self.session: Optional[aiohttp.ClientSession] = None
@@ -54,7 +61,10 @@ class PubMedClient:
 
     async def __aenter__(self) -> "PubMedClient":
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession(timeout=self.timeout)
+        # One pooled session per batch: keep-alive connections and cached DNS
+        # are reused across every esearch/efetch call instead of reconnecting
+        connector = aiohttp.TCPConnector(limit=self.max_concurrent * 2, ttl_dns_cache=300)
+        self.session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
@@ -361,6 +371,8 @@ async def batch_search(
     api_key: Optional[str] = None,
     progress_callback: Optional[Any] = None,
     config: Optional[Config] = None,
+    cache_manager: Optional[CacheManager] = None,
+    max_concurrent: Optional[int] = None,
 ) -> list[SearchResult]:
     """
     Perform batch search for multiple chemicals.
@@ -373,40 +385,79 @@ async def batch_search(
         api_key: PubMed API key (uses config if None)
         progress_callback: Callback for progress updates
         config: Configuration instance (uses global if None)
+        cache_manager: Cache to serve repeat searches from and store new results in
+            (no caching if None)
+        max_concurrent: Chemicals searched at once (uses config default if None);
+            the client's rate limiter still caps requests per second
 
     Returns:
         List of SearchResult objects
     """
-    import asyncio
-
     config = config or get_config()
 
-    async with PubMedClient(api_key, config) as client:
+    # Resolve defaults up front so cache keys match the parameters actually searched
+    max_results_per_chemical = max_results_per_chemical or config.max_results_per_chemical
+    date_range_years = date_range_years or config.default_date_range_years
+    if include_reviews is None:
+        include_reviews = config.default_include_reviews
+    max_concurrent = max(max_concurrent or config.concurrent_requests, 1)
+
+    async with PubMedClient(api_key, config, max_concurrent) as client:
         # Create semaphore to limit concurrent requests
-        semaphore = asyncio.Semaphore(config.concurrent_requests)
+        semaphore = asyncio.Semaphore(max_concurrent)
 
         async def search_with_semaphore(chemical: Chemical) -> SearchResult:
-            """Search with semaphore control and progress tracking."""
+            """Search with semaphore control, serving cache hits without an API call."""
+            if cache_manager is not None:
+                cached = await asyncio.to_thread(
+                    cache_manager.get,
+                    chemical,
+                    date_range_years,
+                    max_results_per_chemical,
+                    include_reviews,
+                )
+                if cached is not None:
+                    return cached
+
             async with semaphore:
-                return await client.search(
+                result = await client.search(
                     chemical,
                     max_results_per_chemical,
                     date_range_years,
                     include_reviews,
                 )
 
-        # Create all search tasks
-        tasks = [search_with_semaphore(chemical) for chemical in chemicals]
-
-        # Run tasks concurrently with progress updates
-        results = []
+            if cache_manager is not None:
+                await asyncio.to_thread(
+                    cache_manager.save,
+                    result,
+                    date_range_years,
+                    max_results_per_chemical,
+                    include_reviews,
+                )
+            return result
+
+        async def search_at(index: int, chemical: Chemical) -> tuple[int, SearchResult]:
+            """Search a chemical and return its result with its input position."""
+            return index, await search_with_semaphore(chemical)
+
+        # Create all search tasks up front so they start in input order
+        # (as_completed would otherwise schedule them in set order)
+        tasks = [
+            asyncio.create_task(search_at(index, chemical))
+            for index, chemical in enumerate(chemicals)
+        ]
+
+        # Run tasks concurrently with progress updates as each one completes,
+        # storing results by input position so they keep the upload order
+        results: list[Optional[SearchResult]] = [None] * len(chemicals)
         for i, task in enumerate(asyncio.as_completed(tasks)):
-            result = await task
-            results.append(result)
+            index, result = await task
+            results[index] = result
 
             # Progress callback
             if progress_callback:
                 progress = (i + 1) / len(chemicals)
                 await progress_callback(progress, result.chemical)
 
-    return results
+    return [result for result in results if result is not None]
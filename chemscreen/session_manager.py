@@ -2,6 +2,7 @@
 
 import json
 import logging
+from collections.abc import Collection
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
@@ -131,18 +132,11 @@ class SessionManager:
             True if successful, False otherwise
         """
         try:
-            # Find and delete session file
-            session_files = list(self.session_dir.glob(f"session_*_{session_id}.json"))
-
-            if not session_files:
-                logger.warning(f"Session {session_id} not found for deletion")
+            if not self._delete_session_files(session_id):
                 return False
 
-            filepath = session_files[0]
-            filepath.unlink()
-
             # Remove from index
-            self._remove_from_index(session_id)
+            self._remove_from_index({session_id})
 
             logger.info(f"Session {session_id} deleted")
             return True
@@ -151,6 +145,22 @@ class SessionManager:
             logger.error(f"Failed to delete session {session_id}: {e}")
             return False
 
+    def _delete_session_files(self, session_id: str) -> bool:
+        """Delete a session's file, leaving the index to the caller.
+
+        Returns:
+            True if the file was found and deleted, False if it was not found
+        """
+        # Find and delete session file
+        session_files = list(self.session_dir.glob(f"session_*_{session_id}.json"))
+
+        if not session_files:
+            logger.warning(f"Session {session_id} not found for deletion")
+            return False
+
+        session_files[0].unlink()
+        return True
+
     def _update_session_index(self, session: BatchSearchSession, filepath: Path) -> None:
         """Update the session index with new session metadata."""
         try:
@@ -181,19 +191,13 @@ class SessionManager:
 
             # Add new entry
             index_data["sessions"].append(session_metadata)
-            index_data["last_updated"] = datetime.now().isoformat()
-
-            # Save updated index atomically
-            temp_filepath = self.index_file.with_suffix(".json.tmp")
-            with open(temp_filepath, "w", encoding="utf-8") as f:
-                json.dump(index_data, f, indent=2)
-            temp_filepath.rename(self.index_file)
+            self._write_index(index_data)
 
         except Exception as e:
             logger.error(f"Failed to update session index: {e}")
 
-    def _remove_from_index(self, session_id: str) -> None:
-        """Remove session from index."""
+    def _remove_from_index(self, session_ids: Collection[str]) -> None:
+        """Remove sessions from the index, rewriting it once for all of them."""
         try:
             if not self.index_file.exists():
                 return
@@ -201,20 +205,24 @@ class SessionManager:
             with open(self.index_file, "r", encoding="utf-8") as f:
                 index_data = json.load(f)
 
-            # Remove session
+            # Remove sessions
             index_data["sessions"] = [
-                s for s in index_data["sessions"] if s.get("session_id") != session_id
+                s
+                for s in index_data["sessions"]
+                if s.get("session_id") not in session_ids
             ]
-            index_data["last_updated"] = datetime.now().isoformat()
-
-            # Save updated index atomically
-            temp_filepath = self.index_file.with_suffix(".json.tmp")
-            with open(temp_filepath, "w", encoding="utf-8") as f:
-                json.dump(index_data, f, indent=2)
-            temp_filepath.rename(self.index_file)
+            self._write_index(index_data)
 
         except Exception as e:
-            logger.error(f"Failed to remove session from index: {e}")
+            logger.error(f"Failed to remove sessions from index: {e}")
+
+    def _write_index(self, index_data: dict[str, Any]) -> None:
+        """Stamp and save the session index atomically."""
+        index_data["last_updated"] = datetime.now().isoformat()
+        temp_filepath = self.index_file.with_suffix(".json.tmp")
+        with open(temp_filepath, "w", encoding="utf-8") as f:
+            json.dump(index_data, f, indent=2)
+        temp_filepath.rename(self.index_file)
 
     def cleanup_old_sessions(self, days_to_keep: Optional[int] = None) -> int:
         """
@@ -229,20 +237,52 @@ class SessionManager:
         try:
             days_to_keep = days_to_keep or self.config.session_cleanup_days
             cutoff_date = datetime.now().timestamp() - (days_to_keep * 24 * 60 * 60)
-            deleted_count = 0
-
-            sessions = self.list_sessions()
+            deleted_ids = set()
 
-            for session_meta in sessions:
+            # Delete the expired session files, then update the index once
+            # rather than rewriting it for every deleted session
+            for session_meta in self.list_sessions():
                 session_date = datetime.fromisoformat(session_meta["created_at"])
+                if session_date.timestamp() >= cutoff_date:
+                    continue
 
-                if session_date.timestamp() < cutoff_date:
-                    if self.delete_session(session_meta["session_id"]):
-                        deleted_count += 1
+                session_id = session_meta["session_id"]
+                if self._delete_session_files(session_id):
+                    deleted_ids.add(session_id)
 
+            if deleted_ids:
+                self._remove_from_index(deleted_ids)
+
+            deleted_count = len(deleted_ids)
             logger.info(f"Cleaned up {deleted_count} old sessions")
             return deleted_count
 
         except Exception as e:
             logger.error(f"Failed to cleanup old sessions: {e}")
             return 0
+
+
+# Global session manager instance
+_session_manager: Optional[SessionManager] = None
+
+
+def get_session_manager() -> SessionManager:
+    """
+    Get or create global session manager instance.
+
+    The shared instance is built from the global configuration (get_config).
+    Code that needs a manager with a different configuration should
+    construct its own SessionManager instead.
+    """
+    global _session_manager
+
+    if _session_manager is None:
+        _session_manager = SessionManager()
+
+    return _session_manager
+
+
+def reset_session_manager() -> None:
+    """Reset the global session manager instance (for testing)."""
+    global _session_manager
+    _session_manager = None
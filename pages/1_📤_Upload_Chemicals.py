@@ -3,62 +3,82 @@ Upload Chemicals page for ChemScreen multipage application.
 """
 
 import logging
-import sys
-from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
-# Add the project root to the path
-sys.path.append(str(Path(__file__).parent.parent))
-
 # Import ChemScreen modules
 from chemscreen.cached_processors import (
+    cached_preview_table,
     cached_process_csv_data,
+    cached_read_csv_limited,
     cached_suggest_column_mapping,
 )
-from chemscreen.config import initialize_config
+from chemscreen.config import get_config
 from chemscreen.errors import (
     log_error_for_support,
     show_error_with_help,
     show_validation_help,
 )
-from chemscreen.models import CSVColumnMapping
-from chemscreen.processor import detect_duplicates, merge_duplicates
-from shared.app_utils import init_session_state
+from chemscreen.models import CSVColumnMapping, CSVUploadResult
+from chemscreen.processor import merge_duplicates
 
 # Import shared utilities
+from shared.session_init import store_chemicals
 from shared.ui_utils import (
+    BALLOONS_MAX_BATCH_SIZE,
     create_progress_with_cancel,
     get_feature_help,
-    load_custom_css,
-    setup_sidebar,
     show_help_tooltip,
     show_success_with_stats,
 )
 
-# Initialize configuration and logging
-config = initialize_config()
-logging.basicConfig(
-    level=getattr(logging, config.log_level),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+config = get_config()
 logger = logging.getLogger(__name__)
 
-# Page configuration
-st.set_page_config(
-    page_title="Upload Chemicals - ChemScreen",
-    page_icon="📤",
-    layout="wide",
-    initial_sidebar_state="expanded",
-)
-
-# Initialize session state and UI
-init_session_state()
-load_custom_css()
-
-setup_sidebar()
+# Page title and icon (from _PAGES), layout, session state and sidebar are set up
+# by ChemScreen.py, which runs this page through st.navigation
+
+
+def _set_preview_page(page: int) -> None:
+    """Jump the upload preview to a page (runs as a button callback, before the rerun)."""
+    st.session_state.preview_page_selector = page
+
+
+def _build_processing_summary(
+    result: CSVUploadResult,
+) -> dict[str, tuple[Any, str | None]]:
+    """Render the processing summary metrics once as {label: (value, delta)}, in order."""
+    valid_count = len(result.valid_chemicals)
+    invalid_count = len(result.invalid_rows)
+    success_rate = result.success_rate
+    return {
+        "Total Rows": (result.total_rows, None),
+        "Valid Chemicals": (valid_count, f"{valid_count - invalid_count} processed"),
+        "Invalid Rows": (invalid_count, f"-{invalid_count}" if invalid_count else None),
+        "Success Rate": (
+            f"{success_rate:.1f}%",
+            "Good" if success_rate >= 90 else "Check data",
+        ),
+    }
+
+
+def _invalid_rows_frame(invalid_rows: list[dict[str, Any]]) -> pd.DataFrame:
+    """Flatten invalid row records into one table row each for a single st.dataframe."""
+    return pd.DataFrame(
+        {
+            "Row": [error["row_number"] for error in invalid_rows],
+            "Errors": [
+                "; ".join(
+                    f"{detail['field']}: {detail['message']}"
+                    for detail in error["errors"]
+                )
+                for error in invalid_rows
+            ],
+        }
+    )
 
 
 def show_upload_page() -> None:
@@ -80,8 +100,11 @@ def show_upload_page() -> None:
                     f"⚠️ Processing Warnings ({len(result['warnings'])})",
                     expanded=False,
                 ):
-                    for warning in result["warnings"]:
-                        st.warning(warning)
+                    st.dataframe(
+                        pd.DataFrame({"Warning": result["warnings"]}),
+                        use_container_width=True,
+                        hide_index=True,
+                    )
 
             # Show invalid rows if any (expected for large dataset with edge cases)
             if result.get("invalid_rows"):
@@ -89,8 +112,12 @@ def show_upload_page() -> None:
                     f"❌ Invalid Rows ({len(result['invalid_rows'])})", expanded=False
                 ):
                     st.info("These are intentional edge cases in the demo data:")
-                    for error in result["invalid_rows"]:
-                        st.error(f"Row {error['row_number']}: {error['errors']}")
+                    st.dataframe(
+                        _invalid_rows_frame(result["invalid_rows"]),
+                        use_container_width=True,
+                        hide_index=True,
+                        height=300,
+                    )
 
             # Navigate to search page after loading
             st.page_link("pages/2_🔍_Search.py", label="Go to Search", icon="▶️")
@@ -127,18 +154,35 @@ def show_upload_page() -> None:
         )
 
         if uploaded_file is not None:
+            # Reject empty and oversized uploads before touching the bytes
+            file_size = uploaded_file.size
+            if file_size == 0:
+                show_error_with_help("file_empty")
+                return
+            if file_size > config.max_upload_size_mb * 1024 * 1024:
+                show_error_with_help(
+                    "file_size",
+                    f"File size: {file_size / 1024 / 1024:.1f}MB "
+                    f"(max: {config.max_upload_size_mb}MB)",
+                )
+                return
+
             try:
-                # Check file size (10MB limit)
-                file_size = uploaded_file.size
-                if file_size > 10 * 1024 * 1024:  # 10MB in bytes
-                    show_error_with_help(
-                        "file_size",
-                        f"File size: {file_size / 1024 / 1024:.1f}MB (max: 10MB)",
+                # Read CSV file in chunks, stopping once it is known to exceed one
+                # batch, so the row count is a lower bound for oversized files.
+                # The parsed frame is memoized per upload so reruns skip hashing the bytes.
+                MAX_BATCH_SIZE = config.max_batch_size
+                upload_key = (uploaded_file.file_id, MAX_BATCH_SIZE)
+                parsed_upload = st.session_state.get("parsed_upload")
+                if parsed_upload is None or parsed_upload[0] != upload_key:
+                    parsed_upload = (
+                        upload_key,
+                        *cached_read_csv_limited(
+                            uploaded_file.getvalue(), MAX_BATCH_SIZE, count_all=False
+                        ),
                     )
-                    return
-
-                # Read CSV file
-                df = pd.read_csv(uploaded_file)
+                    st.session_state.parsed_upload = parsed_upload
+                _, df, total_file_rows = parsed_upload
 
                 # Check if empty
                 if df.empty:
@@ -146,20 +190,18 @@ def show_upload_page() -> None:
                     return
 
                 # Check batch size limits
-                MAX_BATCH_SIZE = config.max_batch_size
-                if len(df) > MAX_BATCH_SIZE:
+                if total_file_rows > MAX_BATCH_SIZE:
                     show_error_with_help(
                         "batch_too_large",
-                        f"{len(df)} chemicals found (max: {MAX_BATCH_SIZE})",
+                        f"File exceeds the {MAX_BATCH_SIZE}-chemical limit",
                         expand_help=True,
                     )
 
-                    # Offer to truncate
+                    # Offer to truncate (only the first MAX_BATCH_SIZE rows were kept)
                     if st.checkbox(
                         f"Process only the first {MAX_BATCH_SIZE} chemicals?",
                         key="truncate_large_file",
                     ):
-                        df = df.head(MAX_BATCH_SIZE)
                         st.warning(
                             f"⚠️ Dataset truncated to {MAX_BATCH_SIZE} chemicals for processing."
                         )
@@ -174,6 +216,7 @@ def show_upload_page() -> None:
                 # Pagination for large datasets
                 ROWS_PER_PAGE = 100
                 total_rows = len(df)
+                preview_table = cached_preview_table(upload_key, df)
 
                 if total_rows > ROWS_PER_PAGE:
                     st.info(
@@ -183,6 +226,10 @@ def show_upload_page() -> None:
                     # Calculate total pages
                     total_pages = (total_rows + ROWS_PER_PAGE - 1) // ROWS_PER_PAGE
 
+                    # A previous upload may have left the selector past the last page
+                    if st.session_state.get("preview_page_selector", 1) > total_pages:
+                        st.session_state.preview_page_selector = 1
+
                     # Page selector
                     col1, col2, col3 = st.columns([1, 2, 1])
                     with col2:
@@ -196,53 +243,61 @@ def show_upload_page() -> None:
                     # Calculate row indices for current page
                     start_idx = (page_num - 1) * ROWS_PER_PAGE
                     end_idx = min(start_idx + ROWS_PER_PAGE, total_rows)
-                    preview_df = df.iloc[start_idx:end_idx]
+                    preview_data = preview_table.slice(start_idx, end_idx - start_idx)
 
-                    # Navigation buttons
+                    # Navigation buttons set the selector in a callback, so a click
+                    # takes effect in the rerun it triggers
                     nav_col1, nav_col2, nav_col3, nav_col4, nav_col5 = st.columns(
                         [1, 1, 2, 1, 1]
                     )
                     with nav_col1:
-                        if st.button(
-                            "⏮️ First", disabled=page_num == 1, use_container_width=True
-                        ):
-                            st.rerun()
+                        st.button(
+                            "⏮️ First",
+                            disabled=page_num == 1,
+                            use_container_width=True,
+                            on_click=_set_preview_page,
+                            args=(1,),
+                        )
                     with nav_col2:
-                        if st.button(
+                        st.button(
                             "◀️ Previous",
                             disabled=page_num == 1,
                             use_container_width=True,
-                        ):
-                            st.rerun()
+                            on_click=_set_preview_page,
+                            args=(page_num - 1,),
+                        )
                     with nav_col3:
                         st.markdown(
                             f"<center>Showing rows {start_idx + 1:,} - {end_idx:,} of {total_rows:,}</center>",
                             unsafe_allow_html=True,
                         )
                     with nav_col4:
-                        if st.button(
+                        st.button(
                             "Next ▶️",
                             disabled=page_num == total_pages,
                             use_container_width=True,
-                        ):
-                            st.rerun()
+                            on_click=_set_preview_page,
+                            args=(page_num + 1,),
+                        )
                     with nav_col5:
-                        if st.button(
+                        st.button(
                             "Last ⏭️",
                             disabled=page_num == total_pages,
                             use_container_width=True,
-                        ):
-                            st.rerun()
+                            on_click=_set_preview_page,
+                            args=(total_pages,),
+                        )
                 else:
-                    preview_df = df
+                    preview_data = preview_table
                     st.info(f"Showing all {total_rows} rows")
 
                 # Display with virtual scrolling for performance
+                # (row positions are shown in the caption, Arrow slices have no index)
                 st.dataframe(
-                    preview_df,
+                    preview_data,
                     use_container_width=True,
                     height=400,  # Fixed height for virtual scrolling
-                    hide_index=False,
+                    hide_index=True,
                 )
 
                 # Column mapping
@@ -255,12 +310,22 @@ def show_upload_page() -> None:
                 )
 
                 # Auto-detect columns
-                suggested_mapping = cached_suggest_column_mapping(df)
+                suggested_mapping = cached_suggest_column_mapping(tuple(df.columns))
+                # No suggestion when neither a name nor a CAS column is recognised
+                suggested_name = (
+                    suggested_mapping.name_column if suggested_mapping else None
+                )
+                suggested_cas = (
+                    suggested_mapping.cas_column if suggested_mapping else None
+                )
 
                 col_names = df.columns.tolist()
 
+                # Selectbox option positions ("None" comes first)
+                col_option_index = {col: i + 1 for i, col in enumerate(col_names)}
+
                 # Show auto-detection results if found
-                if suggested_mapping.name_column or suggested_mapping.cas_column:
+                if suggested_mapping is not None:
                     st.success("🔍 Auto-detected column mappings:")
                     detected_cols = []
                     if suggested_mapping.name_column:
@@ -287,10 +352,7 @@ def show_upload_page() -> None:
                     name_col = st.selectbox(
                         "Chemical Name Column",
                         options=["None"] + col_names,
-                        index=col_names.index(suggested_mapping.name_column) + 1
-                        if suggested_mapping.name_column
-                        and suggested_mapping.name_column in col_names
-                        else 0,
+                        index=col_option_index.get(suggested_name or "", 0),
                         help="Column containing chemical names",
                         key="name_column_select",
                     )
@@ -299,10 +361,7 @@ def show_upload_page() -> None:
                     cas_col = st.selectbox(
                         "CAS Number Column",
                         options=["None"] + col_names,
-                        index=col_names.index(suggested_mapping.cas_column) + 1
-                        if suggested_mapping.cas_column
-                        and suggested_mapping.cas_column in col_names
-                        else 0,
+                        index=col_option_index.get(suggested_cas or "", 0),
                         help="Column containing CAS Registry Numbers",
                         key="cas_column_select",
                     )
@@ -313,12 +372,18 @@ def show_upload_page() -> None:
                 else:
                     # Show selected column preview
                     with st.expander("View Selected Columns", expanded=True):
-                        preview_cols = []
-                        if name_col != "None":
-                            preview_cols.append(name_col)
-                        if cas_col != "None":
-                            preview_cols.append(cas_col)
-                        st.dataframe(df[preview_cols].head(10), use_container_width=True)
+                        # Zero-copy view of the cached Arrow table: the first ten
+                        # rows of each selected column, listed once even if the
+                        # same column is chosen for both name and CAS
+                        preview_cols = list(
+                            dict.fromkeys(
+                                col for col in (name_col, cas_col) if col != "None"
+                            )
+                        )
+                        st.dataframe(
+                            preview_table.slice(0, 10).select(preview_cols),
+                            use_container_width=True,
+                        )
 
                     if st.button("Process Chemicals", type="primary"):
                         # Create progress indicators with cancel option
@@ -347,15 +412,6 @@ def show_upload_page() -> None:
                                 progress_container.empty()
                                 return
 
-                            # Initial validation and batch size check
-                            if len(df) > MAX_BATCH_SIZE:
-                                show_error_with_help(
-                                    "batch_too_large",
-                                    f"{len(df)} chemicals (max: {MAX_BATCH_SIZE})",
-                                )
-                                progress_container.empty()
-                                return
-
                             status_text.text("🔍 Processing chemicals...")
                             progress_bar.progress(0.3)
 
@@ -365,46 +421,21 @@ def show_upload_page() -> None:
                             progress_bar.progress(0.9)
 
                             # Store validated chemicals
-                            st.session_state.chemicals = result.valid_chemicals
-
-                            # Complete progress
-                            progress_bar.progress(1.0)
-                            status_text.text("✅ Processing complete!")
+                            store_chemicals(result.valid_chemicals)
 
-                            # Clear progress indicators after a short delay
-                            import time
-
-                            time.sleep(0.5)
+                            # Processing is done; clear the progress indicators
                             progress_container.empty()
 
                             # Display comprehensive results
                             st.subheader("📊 Processing Summary")
 
-                            col1, col2, col3, col4 = st.columns(4)
-                            with col1:
-                                st.metric("Total Rows", result.total_rows)
-                            with col2:
-                                st.metric(
-                                    "Valid Chemicals",
-                                    len(result.valid_chemicals),
-                                    delta=f"{len(result.valid_chemicals) - len(result.invalid_rows)} processed",
-                                )
-                            with col3:
-                                st.metric(
-                                    "Invalid Rows",
-                                    len(result.invalid_rows),
-                                    delta=None
-                                    if len(result.invalid_rows) == 0
-                                    else "-" + str(len(result.invalid_rows)),
-                                )
-                            with col4:
-                                st.metric(
-                                    "Success Rate",
-                                    f"{result.success_rate:.1f}%",
-                                    delta="Good"
-                                    if result.success_rate >= 90
-                                    else "Check data",
-                                )
+                            # Format the metrics once per batch and render from the dict
+                            summary = _build_processing_summary(result)
+                            for metric_col, (label, (value, delta)) in zip(
+                                st.columns(len(summary)), summary.items()
+                            ):
+                                with metric_col:
+                                    st.metric(label, value, delta=delta)
 
                             # Show warnings if any
                             if result.warnings:
@@ -412,41 +443,44 @@ def show_upload_page() -> None:
                                     f"⚠️ Warnings ({len(result.warnings)})",
                                     expanded=False,
                                 ):
-                                    for warning in result.warnings:
-                                        st.warning(warning)
+                                    st.dataframe(
+                                        pd.DataFrame({"Warning": result.warnings}),
+                                        use_container_width=True,
+                                        hide_index=True,
+                                    )
 
                             # Show errors if any with enhanced help
                             if result.invalid_rows:
                                 show_validation_help(result.invalid_rows, expand=True)
 
                             # Check for duplicates and offer to merge
-                            if result.valid_chemicals:
-                                duplicates = detect_duplicates(result.valid_chemicals)
-                                if duplicates:
-                                    st.warning(
-                                        f"Found {len(duplicates)} duplicate chemicals."
+                            if result.duplicates:
+                                st.warning(
+                                    f"Found {len(result.duplicates)} duplicate chemicals."
+                                )
+                                if st.checkbox("Merge duplicates?", value=True):
+                                    result.valid_chemicals = merge_duplicates(
+                                        result.valid_chemicals, result.duplicates
+                                    )
+                                    result.duplicates = []
+                                    store_chemicals(result.valid_chemicals)
+                                    st.info(
+                                        f"Merged to {len(result.valid_chemicals)} unique chemicals."
                                     )
-                                    if st.checkbox("Merge duplicates?", value=True):
-                                        result.valid_chemicals = merge_duplicates(
-                                            result.valid_chemicals
-                                        )
-                                        st.session_state.chemicals = (
-                                            result.valid_chemicals
-                                        )
-                                        st.info(
-                                            f"Merged to {len(result.valid_chemicals)} unique chemicals."
-                                        )
 
                             if result.valid_chemicals:
                                 # Use the new success with stats function
+                                success_rate_text, _ = summary["Success Rate"]
                                 stats = {
                                     "Valid Chemicals": len(result.valid_chemicals),
-                                    "Success Rate": f"{result.success_rate:.1f}%",
+                                    "Success Rate": success_rate_text,
                                     "Invalid Rows": len(result.invalid_rows),
                                 }
                                 show_success_with_stats(
                                     f"Successfully processed {len(result.valid_chemicals)} chemicals!",
                                     stats,
+                                    show_balloons=len(result.valid_chemicals)
+                                    <= BALLOONS_MAX_BATCH_SIZE,
                                 )
 
                                 # Show simplified preview of processed chemicals
@@ -455,24 +489,50 @@ def show_upload_page() -> None:
                                 ):
                                     # Show first 10 chemicals in a simple table
                                     preview_chemicals = result.valid_chemicals[:10]
-                                    preview_data = []
-                                    for i, chem in enumerate(preview_chemicals):
-                                        preview_data.append(
+
+                                    if preview_chemicals:
+                                        # Flag every chemical involved in a duplicate pair
+                                        duplicate_mask = np.zeros(
+                                            len(result.valid_chemicals), dtype=bool
+                                        )
+                                        if result.duplicates:
+                                            duplicate_mask[
+                                                np.asarray(result.duplicates).ravel()
+                                            ] = True
+
+                                        # Build the table column-wise rather than one dict per row
+                                        processed_preview_df = pd.DataFrame(
                                             {
-                                                "Chemical Name": chem.name,
-                                                "CAS Number": chem.cas_number or "N/A",
-                                                "Validated": "✅"
-                                                if chem.validated
-                                                else "⚠️",
-                                                "Synonyms": len(chem.synonyms)
-                                                if chem.synonyms
-                                                else 0,
+                                                "Chemical Name": [
+                                                    c.name for c in preview_chemicals
+                                                ],
+                                                "CAS Number": [
+                                                    c.cas_number or "N/A"
+                                                    for c in preview_chemicals
+                                                ],
+                                                "Validated": np.where(
+                                                    [
+                                                        c.validated
+                                                        for c in preview_chemicals
+                                                    ],
+                                                    "✅",
+                                                    "⚠️",
+                                                ),
+                                                "Synonyms": [
+                                                    len(c.synonyms)
+                                                    for c in preview_chemicals
+                                                ],
+                                                "Duplicate": np.where(
+                                                    duplicate_mask[
+                                                        : len(preview_chemicals)
+                                                    ],
+                                                    "🔁",
+                                                    "",
+                                                ),
                                             }
                                         )
-
-                                    if preview_data:
                                         st.dataframe(
-                                            pd.DataFrame(preview_data),
+                                            processed_preview_df,
                                             use_container_width=True,
                                         )
 
@@ -523,7 +583,4 @@ def show_upload_page() -> None:
 
 
 # Main execution
-if __name__ == "__main__":
-    show_upload_page()
-else:
-    show_upload_page()
+show_upload_page()
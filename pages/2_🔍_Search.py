@@ -4,60 +4,45 @@ Search page for ChemScreen multipage application.
 
 import asyncio
 import logging
-import sys
-import time
 from datetime import datetime
-from pathlib import Path
 from typing import Any
+from uuid import uuid4
 
 import pandas as pd
 import streamlit as st
 
-# Add the project root to the path
-sys.path.append(str(Path(__file__).parent.parent))
-
 # Import ChemScreen modules
-from chemscreen.config import initialize_config
+from chemscreen.cache import get_cache_manager
+from chemscreen.config import get_config
 from chemscreen.errors import (
     log_error_for_support,
     show_error_with_help,
 )
 from chemscreen.models import BatchSearchSession, Chemical, SearchParameters
-from chemscreen.pubmed import batch_search
-from chemscreen.session_manager import SessionManager
-from shared.app_utils import init_session_state
+from chemscreen.session_manager import get_session_manager
 
 # Import shared utilities
+from shared.session_init import store_search_results
 from shared.ui_utils import (
+    BALLOONS_MAX_BATCH_SIZE,
     create_progress_with_cancel,
     get_feature_help,
-    load_custom_css,
-    setup_sidebar,
+    paginate,
     show_help_tooltip,
     show_success_with_stats,
 )
 
-# Initialize configuration and logging
-config = initialize_config()
-logging.basicConfig(
-    level=getattr(logging, config.log_level),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+config = get_config()
 logger = logging.getLogger(__name__)
 
-# Page configuration
-st.set_page_config(
-    page_title="Search - ChemScreen",
-    page_icon="🔍",
-    layout="wide",
-    initial_sidebar_state="expanded",
-)
+# Rows per page in the "View Chemical List" preview
+CHEMICAL_LIST_PAGE_SIZE = 50
 
-# Initialize session state and UI
-init_session_state()
-load_custom_css()
+# Search progress is redrawn at most this many times per batch (every 5%)
+PROGRESS_UPDATE_STEPS = 20
 
-setup_sidebar()
+# Page title and icon (from _PAGES), layout, session state and sidebar are set up
+# by ChemScreen.py, which runs this page through st.navigation
 
 
 def show_search_page() -> None:
@@ -66,8 +51,9 @@ def show_search_page() -> None:
 
     if not st.session_state.chemicals:
         st.warning("⚠️ No chemicals loaded. Please upload a chemical list first.")
-        if st.button("Go to Upload Page"):
-            st.switch_page("pages/1_📤_Upload_Chemicals.py")
+        st.page_link(
+            "pages/1_📤_Upload_Chemicals.py", label="Go to Upload Page", icon="▶️"
+        )
         return
 
     # Search configuration
@@ -80,32 +66,48 @@ def show_search_page() -> None:
         help_info = get_feature_help("search_settings")
         show_help_tooltip(help_info["title"], help_info["content"], help_info["icon"])
 
-        _date_range = st.slider(
-            "Publication Date Range (years)",
-            min_value=1,
-            max_value=20,
-            value=st.session_state.settings["date_range_years"],
-            help="Search for publications from the last N years",
-        )
+        # Batch parameter edits in a form; Start Search uses the last applied values
+        with st.form("search_config", border=False):
+            _date_range = st.slider(
+                "Publication Date Range (years)",
+                min_value=1,
+                max_value=20,
+                value=st.session_state.settings["date_range_years"],
+                help="Search for publications from the last N years",
+            )
 
-        _max_results = st.number_input(
-            "Maximum Results per Chemical",
-            min_value=10,
-            max_value=10000,
-            value=st.session_state.settings["max_results_per_chemical"],
-            step=10,
-        )
+            _max_results = st.number_input(
+                "Maximum Results per Chemical",
+                min_value=10,
+                max_value=10000,
+                value=st.session_state.settings["max_results_per_chemical"],
+                step=10,
+            )
 
-        _include_reviews = st.checkbox(
-            "Include Review Articles",
-            value=st.session_state.settings["include_reviews"],
-        )
+            _include_reviews = st.checkbox(
+                "Include Review Articles",
+                value=st.session_state.settings["include_reviews"],
+            )
 
-        _use_cache = st.checkbox(
-            "Use Cached Results",
-            value=st.session_state.settings["cache_enabled"],
-            help="Use previously cached results when available",
-        )
+            _use_cache = st.checkbox(
+                "Use Cached Results",
+                value=st.session_state.settings["cache_enabled"],
+                help="Use previously cached results when available",
+            )
+
+            _max_concurrent = st.number_input(
+                "Concurrent Searches",
+                min_value=1,
+                max_value=10,
+                value=st.session_state.settings["max_concurrent_searches"],
+                help="Chemicals searched at the same time (requests stay rate-limited)",
+            )
+
+            st.form_submit_button("Apply Parameters", use_container_width=True)
+
+        if st.button("🗑️ Clear Search Cache", help="Delete all cached PubMed results"):
+            cleared = get_cache_manager().clear()
+            st.success(f"Cleared {cleared} cached searches.")
 
     with col2:
         st.subheader("Batch Information")
@@ -113,7 +115,7 @@ def show_search_page() -> None:
         # Add help for batch processing
         help_info = get_feature_help("batch_processing")
         show_help_tooltip(help_info["title"], help_info["content"], help_info["icon"])
-        chemical_count = len(st.session_state.chemicals)
+        chemical_count = st.session_state.chemicals_count
         MAX_BATCH_SIZE = config.max_batch_size
 
         if chemical_count > MAX_BATCH_SIZE:
@@ -137,31 +139,86 @@ def show_search_page() -> None:
 
     st.markdown("---")
 
-    # Chemical list preview
+    # Chemical list preview, built only once the user asks for it (the
+    # expander body runs on every rerun even while collapsed)
     with st.expander("View Chemical List", expanded=False):
-        # Convert Chemical objects to a display-friendly DataFrame
-        if st.session_state.chemicals:
-            chemicals_data = []
-            for chemical in st.session_state.chemicals:
-                chemicals_data.append(
-                    {
-                        "Name": chemical.name,
-                        "CAS Number": chemical.cas_number or "N/A",
-                        "Synonyms": ", ".join(chemical.synonyms)
-                        if chemical.synonyms
-                        else "None",
-                        "Validated": "✅" if chemical.validated else "❌",
-                        "Notes": chemical.notes or "",
-                    }
-                )
-            chemicals_df = pd.DataFrame(chemicals_data)
-            st.dataframe(chemicals_df, use_container_width=True)
-        else:
-            st.info("No chemicals loaded.")
+        if st.checkbox("Show chemical list", key="show_chemical_list"):
+            _render_chemical_list()
 
     # Search execution
     st.subheader("Execute Search")
 
+    _render_search_execution(
+        int(_date_range),
+        int(_max_results),
+        _include_reviews,
+        _use_cache,
+        int(_max_concurrent),
+    )
+
+
+def _render_chemical_list() -> None:
+    """Show the page of the loaded chemical list selected by the pager."""
+    # Convert Chemical objects to a display-friendly DataFrame
+    if st.session_state.chemicals:
+        # Only build and send the rows on the selected page
+        start, end = paginate(
+            st.session_state.chemicals_count,
+            CHEMICAL_LIST_PAGE_SIZE,
+            key="chemical_list_page",
+        )
+        # The page table is memoized until the page or the loaded list
+        # changes; store_chemicals replaces the list on every load, and
+        # the memo holds it so its identity can't be reused
+        chemicals = st.session_state.chemicals
+        chemical_table = st.session_state.get("chemical_list_table")
+        if (
+            chemical_table is None
+            or chemical_table[0] is not chemicals
+            or chemical_table[1] != (start, end)
+        ):
+            page_chemicals = chemicals[start:end]
+
+            # Build the table column-wise rather than one dict per row
+            chemical_table = (
+                chemicals,
+                (start, end),
+                pd.DataFrame(
+                    {
+                        "Name": [c.name for c in page_chemicals],
+                        "CAS Number": [c.cas_number or "N/A" for c in page_chemicals],
+                        "Synonyms": [
+                            ", ".join(c.synonyms) if c.synonyms else "None"
+                            for c in page_chemicals
+                        ],
+                        "Validated": [
+                            "✅" if c.validated else "❌" for c in page_chemicals
+                        ],
+                        "Notes": [c.notes or "" for c in page_chemicals],
+                    }
+                ),
+            )
+            st.session_state.chemical_list_table = chemical_table
+        chemicals_df = chemical_table[2]
+        st.dataframe(chemicals_df, use_container_width=True, hide_index=True)
+    else:
+        st.info("No chemicals loaded.")
+
+
+@st.fragment
+def _render_search_execution(
+    date_range_years: int,
+    max_results: int,
+    include_reviews: bool,
+    use_cache: bool,
+    max_concurrent: int,
+) -> None:
+    """
+    Render the search controls, progress and outcome.
+
+    Runs as a fragment so the Start/Pause/Cancel buttons and the results
+    summary rerun only this section, not the parameter form and chemical list.
+    """
     col1, col2, col3 = st.columns([1, 1, 2])
 
     # Initialize cancellation flag
@@ -170,20 +227,20 @@ def show_search_page() -> None:
 
     with col1:
         if st.button("🚀 Start Search", type="primary", use_container_width=True):
-            st.session_state.current_batch_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+            # Imported on first use: the PubMed client pulls in aiohttp, which
+            # only a search needs
+            from chemscreen.pubmed import batch_search
+
+            # Timestamped for readability, with a random suffix so batches
+            # started in the same second by different users never share an ID
+            st.session_state.current_batch_id = (
+                f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid4().hex[:8]}"
+            )
             # Reset cancellation flag at the start of a new search
             st.session_state.search_cancelled = False
 
-            # Get search parameters from UI inputs
-            date_range_years = _date_range
-            max_results = _max_results
-            include_reviews = _include_reviews
             api_key = config.pubmed_api_key
 
-            # Enhanced loading states
-            with st.spinner("Initializing search..."):
-                time.sleep(1)
-
             # Create progress with cancel functionality
             progress_bar: Any
             status_text: Any
@@ -203,13 +260,28 @@ def show_search_page() -> None:
             # Get all chemicals to search
             chemicals_to_search = st.session_state.chemicals
 
-            # Progress callback function
+            # Progress callback function. Updates are limited to
+            # PROGRESS_UPDATE_STEPS steps so large batches send at most that
+            # many progress deltas.
+            last_step = -1
+
             async def progress_callback(progress: float, chemical: Chemical) -> None:
+                nonlocal last_step
                 if st.session_state.search_cancelled:
                     raise asyncio.CancelledError("Search cancelled by user.")
 
-                progress_bar.progress(progress)
-                status_text.text(f"🔍 Searching PubMed for: {chemical.name}")
+                step = int(progress * PROGRESS_UPDATE_STEPS)
+                if step == last_step:
+                    return
+                last_step = step
+
+                # The bar's own label carries the status
+                progress_bar.progress(
+                    progress, text=f"🔍 Searching PubMed for: {chemical.name}"
+                )
+
+            # Label the bar until the first search completes and reports
+            progress_bar.progress(0, text="🔄 Initializing search...")
 
             try:
                 # Run the async batch search
@@ -221,27 +293,26 @@ def show_search_page() -> None:
                         include_reviews=include_reviews,
                         api_key=api_key,
                         progress_callback=progress_callback,
+                        cache_manager=get_cache_manager() if use_cache else None,
+                        max_concurrent=max_concurrent,
                     )
                 )
 
-                progress_bar.progress(1.0)
-                status_text.text("✅ Search complete!")
-                time.sleep(0.5)
                 progress_container.empty()
 
                 # Store results in session state
-                st.session_state.search_results = search_results
+                store_search_results(search_results)
 
                 # Save session for persistence and history
                 try:
-                    session_manager = SessionManager()
+                    session_manager = get_session_manager()
 
                     # Create search parameters object
                     search_params = SearchParameters(
                         date_range_years=date_range_years,
                         max_results=max_results,
                         include_reviews=include_reviews,
-                        use_cache=_use_cache,
+                        use_cache=use_cache,
                     )
 
                     # Create BatchSearchSession object
@@ -264,11 +335,10 @@ def show_search_page() -> None:
                     logger.error(f"Failed to save session: {e}")
                     # Don't fail the search if session saving fails
 
-                # Calculate real stats
-                total_papers = sum(len(result.publications) for result in search_results)
+                # Real stats (paper count maintained by store_search_results)
                 stats = {
                     "Chemicals Searched": len(chemicals_to_search),
-                    "Papers Found": total_papers,
+                    "Papers Found": st.session_state.total_papers,
                     "API Calls": len(
                         [result for result in search_results if not result.from_cache]
                     ),
@@ -276,6 +346,7 @@ def show_search_page() -> None:
                 show_success_with_stats(
                     f"Batch search completed! Batch ID: {st.session_state.current_batch_id}",
                     stats,
+                    show_balloons=len(chemicals_to_search) <= BALLOONS_MAX_BATCH_SIZE,
                 )
 
                 # Navigate to results page
@@ -323,7 +394,4 @@ def show_search_page() -> None:
 
 
 # Main execution
-if __name__ == "__main__":
-    show_search_page()
-else:
-    show_search_page()
+show_search_page()
@@ -3,45 +3,205 @@ Results page for ChemScreen multipage application.
 """
 
 import logging
-import sys
 from datetime import datetime
-from pathlib import Path
+from typing import Any
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
-# Add the project root to the path
-sys.path.append(str(Path(__file__).parent.parent))
-
 # Import ChemScreen modules
-from chemscreen.analyzer import calculate_quality_metrics
-from chemscreen.config import initialize_config
-from shared.app_utils import init_session_state
+from chemscreen.models import QualityMetrics, SearchResult
 
 # Import shared utilities
-from shared.ui_utils import load_custom_css, setup_sidebar
+from shared.session_init import get_quality_metrics, get_results_token
+from shared.ui_utils import paginate
 
-# Initialize configuration and logging
-config = initialize_config()
-logging.basicConfig(
-    level=getattr(logging, config.log_level),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
-# Page configuration
-st.set_page_config(
-    page_title="Results - ChemScreen",
-    page_icon="📊",
-    layout="wide",
-    initial_sidebar_state="expanded",
+# Page title and icon (from _PAGES), layout, session state and sidebar are set up
+# by ChemScreen.py, which runs this page through st.navigation
+
+# Per-batch table caches: recent batches only, dropped after an hour
+_BATCH_CACHE_MAX_ENTRIES = 16
+_BATCH_CACHE_TTL = 3600  # seconds
+
+# Rows per page for the results tables
+RESULTS_PAGE_SIZE = 100
+
+# Quality score tiers: low below 50, medium 50-79, high 80 and above
+_QUALITY_TIER_BINS = [float("-inf"), 50, 80, float("inf")]
+_QUALITY_TIER_LABELS = ["low", "medium", "high"]
+
+_RESULTS_COLUMN_CONFIG = {
+    "Quality Score": st.column_config.ProgressColumn(
+        "Quality Score",
+        help="Overall quality score based on publication count, recency, and trends",
+        format="%d",
+        min_value=0,
+        max_value=100,
+    ),
+    "Trend": st.column_config.SelectboxColumn(
+        "Publication Trend",
+        help="Publication trend over the last 5 years",
+        options=["Increasing", "Decreasing", "Stable"],
+    ),
+}
+
+_FAILED_COLUMN_CONFIG = {
+    "Search Time": st.column_config.NumberColumn("Search Time", format="%.1fs"),
+}
+
+
+@st.cache_data(
+    show_spinner=False, max_entries=_BATCH_CACHE_MAX_ENTRIES, ttl=_BATCH_CACHE_TTL
 )
+def _build_results_df(
+    results_token: str,
+    _search_results: list[SearchResult],
+    _quality_metrics: list[QualityMetrics],
+) -> pd.DataFrame:
+    """
+    Build the results table with quality metrics for a batch.
+
+    Cached on the results token rather than the results themselves, so
+    reruns skip the frame construction. The cache is shared by every session;
+    the token is unique to one session's stored results, so no session is
+    served another's table. The metrics are computed once per batch by
+    get_quality_metrics, in the same order as the results.
+    """
+    # Built column by column with explicit dtypes: no per-row records and
+    # no dtype inference or conversion afterwards
+    count = len(_search_results)
+    errors = [result.error for result in _search_results]
+
+    return pd.DataFrame(
+        {
+            "Chemical Name": [result.chemical.name for result in _search_results],
+            "CAS Number": [
+                result.chemical.cas_number or "N/A" for result in _search_results
+            ],
+            "Papers Found": np.fromiter(
+                (len(result.publications) for result in _search_results),
+                dtype=np.int32,
+                count=count,
+            ),
+            "Review Articles": np.fromiter(
+                (metrics.review_count for metrics in _quality_metrics),
+                dtype=np.int32,
+                count=count,
+            ),
+            "Recent Papers": np.fromiter(
+                (metrics.recent_publications for metrics in _quality_metrics),
+                dtype=np.int32,
+                count=count,
+            ),
+            "Quality Score": np.fromiter(
+                (int(metrics.quality_score) for metrics in _quality_metrics),
+                dtype=np.int8,
+                count=count,
+            ),
+            "Trend": pd.Categorical(
+                [metrics.publication_trend.title() for metrics in _quality_metrics]
+            ),
+            "Status": pd.Categorical(
+                ["❌ Failed" if error else "✅ Complete" for error in errors]
+            ),
+            # Truncate long error messages for display
+            "Error Details": [
+                (error if len(error) <= 50 else error[:47] + "...") if error else None
+                for error in errors
+            ],
+        }
+    )
+
+
+@st.cache_data(
+    show_spinner=False, max_entries=_BATCH_CACHE_MAX_ENTRIES, ttl=_BATCH_CACHE_TTL
+)
+def _build_results_analytics(
+    results_token: str, _results_df: pd.DataFrame
+) -> dict[str, Any]:
+    """
+    Compute the figures shown in the Results Analysis tabs for a batch.
+
+    Cached on the results token like _build_results_df, so the aggregates
+    and the high priority table are computed once per batch rather than on
+    every rerun, and never shared between sessions.
+    """
+    quality = _results_df["Quality Score"]
+    high_priority = _results_df[
+        (quality >= 70) & (_results_df["Recent Papers"] > 0)
+    ].sort_values("Quality Score", ascending=False)
+
+    return {
+        "avg_score": float(quality.mean()) if len(quality) else 0.0,
+        # Quality tiers, counted in one pass over the scores
+        "tier_counts": pd.cut(
+            quality,
+            bins=_QUALITY_TIER_BINS,
+            labels=_QUALITY_TIER_LABELS,
+            right=False,
+        ).value_counts(),
+        "trend_counts": _results_df["Trend"].value_counts(),
+        "total_reviews": int(_results_df["Review Articles"].sum()),
+        "total_recent": int(_results_df["Recent Papers"].sum()),
+        "high_priority": high_priority[
+            ["Chemical Name", "Quality Score", "Papers Found", "Recent Papers", "Trend"]
+        ],
+    }
+
+
+@st.cache_data(
+    show_spinner=False, max_entries=_BATCH_CACHE_MAX_ENTRIES, ttl=_BATCH_CACHE_TTL
+)
+def _build_failed_table(
+    results_token: str, _search_results: list[SearchResult]
+) -> pd.DataFrame:
+    """
+    Build the failed searches table for a batch.
+
+    Cached on the results token like _build_results_df.
+    """
+    failed_results = [r for r in _search_results if r.error]
+
+    return pd.DataFrame(
+        {
+            "Chemical Name": [r.chemical.name for r in failed_results],
+            "CAS Number": [r.chemical.cas_number or "N/A" for r in failed_results],
+            "Error": [r.error for r in failed_results],
+            # Kept numeric and formatted by _FAILED_COLUMN_CONFIG
+            "Search Time": pd.array(
+                [r.search_time_seconds for r in failed_results], dtype="Float32"
+            ),
+        }
+    )
+
 
-# Initialize session state and UI
-init_session_state()
-load_custom_css()
+@st.cache_data(
+    show_spinner=False, max_entries=_BATCH_CACHE_MAX_ENTRIES, ttl=_BATCH_CACHE_TTL
+)
+def _build_retry_csv(results_token: str, _search_results: list[SearchResult]) -> str:
+    """
+    Serialize the failed searches as a CSV that can be uploaded again to retry them.
+
+    Cached on the results token like _build_failed_table, so the CSV handed
+    to the download button is built once per batch rather than on every rerun.
+    """
+    failed_results = [r for r in _search_results if r.error]
+
+    retry_df = pd.DataFrame(
+        {
+            "chemical_name": [r.chemical.name for r in failed_results],
+            "cas_number": [r.chemical.cas_number or "" for r in failed_results],
+            "synonyms": [", ".join(r.chemical.synonyms) for r in failed_results],
+            "notes": [
+                f"Retry - Previous error: {(r.error or '')[:100]}" for r in failed_results
+            ],
+        }
+    )
 
-setup_sidebar()
+    return retry_df.to_csv(index=False)
 
 
 def show_results_page() -> None:
@@ -53,12 +213,12 @@ def show_results_page() -> None:
         st.page_link("pages/2_🔍_Search.py", label="Go to Search", icon="▶️")
         return
 
-    # Calculate real summary statistics
-    total_chemicals = len(st.session_state.chemicals) if st.session_state.chemicals else 0
+    # Summary statistics come from the counters kept by store_search_results
+    total_chemicals = st.session_state.chemicals_count
     search_results = st.session_state.search_results
-    successful_searches = len([r for r in search_results if not r.error])
-    failed_searches = len([r for r in search_results if r.error])
-    total_papers = sum(len(r.publications) for r in search_results)
+    successful_searches = st.session_state.successful_count
+    failed_searches = st.session_state.total_results - successful_searches
+    total_papers = st.session_state.total_papers
 
     # Results summary
     col1, col2, col3, col4 = st.columns(4)
@@ -77,57 +237,17 @@ def show_results_page() -> None:
     # Results table
     st.subheader("Results Summary")
 
-    # Create results dataframe with real data and quality metrics
-    results_data = []
-    for result in search_results:
-        # Calculate quality metrics for each result
-        metrics = calculate_quality_metrics(result)
-
-        # Determine status and error details
-        if result.error:
-            status = "❌ Failed"
-            error_msg = result.error
-            # Truncate long error messages for display
-            if len(error_msg) > 50:
-                error_msg = error_msg[:47] + "..."
-        else:
-            status = "✅ Complete"
-            error_msg = None
-
-        results_data.append(
-            {
-                "Chemical Name": result.chemical.name,
-                "CAS Number": result.chemical.cas_number or "N/A",
-                "Papers Found": len(result.publications),
-                "Review Articles": metrics.review_count,
-                "Recent Papers": metrics.recent_publications,
-                "Quality Score": int(metrics.quality_score),
-                "Trend": metrics.publication_trend.title(),
-                "Status": status,
-                "Error Details": error_msg,
-            }
-        )
-
-    results_df = pd.DataFrame(results_data)
+    results_df = _build_results_df(
+        get_results_token(), search_results, get_quality_metrics()
+    )
 
+    # Only the selected page of rows is serialized and sent to the browser
+    start, end = paginate(len(results_df), RESULTS_PAGE_SIZE, key="results_page")
     st.dataframe(
-        results_df,
+        results_df.iloc[start:end],
         use_container_width=True,
         hide_index=True,
-        column_config={
-            "Quality Score": st.column_config.ProgressColumn(
-                "Quality Score",
-                help="Overall quality score based on publication count, recency, and trends",
-                format="%d",
-                min_value=0,
-                max_value=100,
-            ),
-            "Trend": st.column_config.SelectboxColumn(
-                "Publication Trend",
-                help="Publication trend over the last 5 years",
-                options=["Increasing", "Decreasing", "Stable"],
-            ),
-        },
+        column_config=_RESULTS_COLUMN_CONFIG,
     )
 
     # Results Analysis
@@ -135,24 +255,22 @@ def show_results_page() -> None:
 
     tab1, tab2, tab3 = st.tabs(["Quality Distribution", "Summary Stats", "High Priority"])
 
+    analytics = _build_results_analytics(get_results_token(), results_df)
+
     with tab1:
         if not results_df.empty:
             # Quality score distribution
             col1, col2 = st.columns(2)
 
             with col1:
-                avg_score = results_df["Quality Score"].mean()
+                avg_score = analytics["avg_score"]
                 st.metric("Average Quality Score", f"{avg_score:.1f}")
 
                 # Quality tiers
-                high_quality = len(results_df[results_df["Quality Score"] >= 80])
-                medium_quality = len(
-                    results_df[
-                        (results_df["Quality Score"] >= 50)
-                        & (results_df["Quality Score"] < 80)
-                    ]
-                )
-                low_quality = len(results_df[results_df["Quality Score"] < 50])
+                tier_counts = analytics["tier_counts"]
+                high_quality = tier_counts["high"]
+                medium_quality = tier_counts["medium"]
+                low_quality = tier_counts["low"]
 
                 st.write("**Quality Tiers:**")
                 st.write(f"🟢 High (80+): {high_quality} chemicals")
@@ -161,7 +279,7 @@ def show_results_page() -> None:
 
             with col2:
                 # Publication trends summary
-                trend_counts = results_df["Trend"].value_counts()
+                trend_counts = analytics["trend_counts"]
                 st.write("**Publication Trends:**")
                 for trend, count in trend_counts.items():
                     icon = (
@@ -180,8 +298,8 @@ def show_results_page() -> None:
             col1, col2 = st.columns(2)
 
             with col1:
-                total_reviews = results_df["Review Articles"].sum()
-                total_recent = results_df["Recent Papers"].sum()
+                total_reviews = analytics["total_reviews"]
+                total_recent = analytics["total_recent"]
                 st.metric("Total Review Articles", total_reviews)
                 st.metric("Recent Publications (3 years)", total_recent)
 
@@ -205,24 +323,17 @@ def show_results_page() -> None:
     with tab3:
         if not results_df.empty:
             # High priority chemicals (high quality score and recent publications)
-            high_priority = results_df[
-                (results_df["Quality Score"] >= 70) & (results_df["Recent Papers"] > 0)
-            ].sort_values("Quality Score", ascending=False)
+            high_priority = analytics["high_priority"]
 
             if not high_priority.empty:
                 st.write(
                     f"**{len(high_priority)} High Priority Chemicals** (Quality Score ≥70 + Recent Publications):"
                 )
+                start, end = paginate(
+                    len(high_priority), RESULTS_PAGE_SIZE, key="high_priority_page"
+                )
                 st.dataframe(
-                    high_priority[
-                        [
-                            "Chemical Name",
-                            "Quality Score",
-                            "Papers Found",
-                            "Recent Papers",
-                            "Trend",
-                        ]
-                    ],
+                    high_priority.iloc[start:end],
                     use_container_width=True,
                     hide_index=True,
                 )
@@ -236,52 +347,24 @@ def show_results_page() -> None:
         st.markdown("---")
         st.subheader("⚠️ Failed Searches")
 
-        # Show failed searches with details
-        failed_results = [r for r in search_results if r.error]
-
         st.warning(
             f"**{failed_searches} search(es) failed.** These chemicals may need to be retried."
         )
 
-        # Create a table of failed searches with error details
-        failed_data = []
-        for result in failed_results:
-            failed_data.append(
-                {
-                    "Chemical Name": result.chemical.name,
-                    "CAS Number": result.chemical.cas_number or "N/A",
-                    "Error": result.error,
-                    "Search Time": f"{result.search_time_seconds:.1f}s"
-                    if result.search_time_seconds
-                    else "N/A",
-                }
-            )
-
-        failed_df = pd.DataFrame(failed_data)
-        st.dataframe(failed_df, use_container_width=True, hide_index=True)
-
-        # Export failed searches as CSV for retry
-        import io
-
-        csv_buffer = io.StringIO()
-        retry_df = pd.DataFrame(
-            [
-                {
-                    "chemical_name": result.chemical.name,
-                    "cas_number": result.chemical.cas_number or "",
-                    "synonyms": ", ".join(result.chemical.synonyms)
-                    if result.chemical.synonyms
-                    else "",
-                    "notes": f"Retry - Previous error: {result.error[:100]}",
-                }
-                for result in failed_results
-            ]
+        # Table of failed searches with error details
+        failed_df = _build_failed_table(get_results_token(), search_results)
+        start, end = paginate(len(failed_df), RESULTS_PAGE_SIZE, key="failed_page")
+        st.dataframe(
+            failed_df.iloc[start:end],
+            use_container_width=True,
+            hide_index=True,
+            column_config=_FAILED_COLUMN_CONFIG,
         )
-        retry_df.to_csv(csv_buffer, index=False)
 
+        # Export failed searches as CSV for retry
         st.download_button(
             label="📥 Download Failed Searches for Retry",
-            data=csv_buffer.getvalue(),
+            data=_build_retry_csv(get_results_token(), search_results),
             file_name=f"failed_searches_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
             mime="text/csv",
             help="Download failed searches as CSV to retry later",
@@ -307,7 +390,4 @@ def show_results_page() -> None:
 
 
 # Main execution
-if __name__ == "__main__":
-    show_results_page()
-else:
-    show_results_page()
+show_results_page()
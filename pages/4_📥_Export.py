@@ -3,56 +3,127 @@ Export page for ChemScreen multipage application.
 """
 
 import logging
-import sys
-import time
 from pathlib import Path
 from typing import Any, Optional
 
 import streamlit as st
 
-# Add the project root to the path
-sys.path.append(str(Path(__file__).parent.parent))
-
 # Import ChemScreen modules
-from chemscreen.analyzer import calculate_quality_metrics
-from chemscreen.config import initialize_config
 from chemscreen.errors import (
     log_error_for_support,
     show_error_with_help,
 )
-from chemscreen.exporter import ExportManager
-from chemscreen.models import BatchSearchSession, SearchParameters
-from shared.app_utils import init_session_state
+from chemscreen.models import (
+    BatchSearchSession,
+    Chemical,
+    QualityMetrics,
+    SearchParameters,
+    SearchResult,
+)
 
 # Import shared utilities
+from shared.session_init import (
+    get_chemicals_token,
+    get_quality_metrics,
+    get_results_token,
+)
 from shared.ui_utils import (
     create_progress_with_cancel,
-    load_custom_css,
-    setup_sidebar,
     show_success_with_stats,
 )
 
-# Initialize configuration and logging
-config = initialize_config()
-logging.basicConfig(
-    level=getattr(logging, config.log_level),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
-# Page configuration
-st.set_page_config(
-    page_title="Export - ChemScreen",
-    page_icon="📥",
-    layout="wide",
-    initial_sidebar_state="expanded",
-)
+# Page title and icon (from _PAGES), layout, session state and sidebar are set up
+# by ChemScreen.py, which runs this page through st.navigation
+
+_EXPORT_MIME_TYPES = {
+    "CSV": "text/csv",
+    "Excel (XLSX)": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "JSON": "application/json",
+}
+
+
+@st.cache_data(max_entries=32, ttl=3600, show_spinner=False)
+def _build_export(
+    batch_id: Optional[str],
+    results_token: str,
+    chemicals_token: str,
+    export_format: str,
+    include_abstracts: bool,
+    search_settings: tuple[int, int, bool, bool],
+    _search_results: list[SearchResult],
+    _quality_metrics: list[QualityMetrics],
+    _chemicals: list[Chemical],
+) -> tuple[str, str, int]:
+    """
+    Generate an export file and return where it was written.
+
+    Cached on the batch, format and options so downloading the same export
+    again does not re-serialize the results.
+    The results and chemicals themselves are not hashed; their tokens,
+    regenerated each time they are stored, identify them. The cache is
+    shared by every session, and a new search or upload gets a new entry
+    rather than a stale export.
+    Only the path is cached, not the file contents, so the cache does not
+    keep a copy of every large export in memory.
+
+    Args:
+        batch_id: Batch the results belong to
+        results_token: Token of the stored results, from get_results_token
+        chemicals_token: Token of the stored chemicals, from get_chemicals_token
+        export_format: One of the keys of _EXPORT_MIME_TYPES
+        include_abstracts: Whether to include publication abstracts
+        search_settings: (date range, max results, include reviews, use cache)
+        _search_results: Search results for the batch
+        _quality_metrics: Quality metrics for each result, in the same order
+        _chemicals: Chemicals in the batch
+
+    Returns:
+        Tuple of (file name, file path, file size in bytes)
+    """
+    # Imported on first export rather than on every visit to the page
+    from chemscreen.exporter import ExportManager
+
+    date_range_years, max_results, include_reviews, use_cache = search_settings
+    session = BatchSearchSession(
+        batch_id=batch_id or "unknown",
+        chemicals=_chemicals,
+        parameters=SearchParameters(
+            date_range_years=date_range_years,
+            max_results=max_results,
+            include_reviews=include_reviews,
+            use_cache=use_cache,
+        ),
+        status="completed",
+    )
+
+    results_with_metrics = list(zip(_search_results, _quality_metrics))
+
+    export_manager = ExportManager()
+    filepath: Optional[Path]
+    if export_format == "Excel (XLSX)":
+        filepath = export_manager.export_to_excel(
+            results=results_with_metrics,
+            session=session,
+            include_abstracts=include_abstracts,
+        )
+    elif export_format == "JSON":
+        filepath = export_manager.export_to_json(
+            results=results_with_metrics, session=session
+        )
+    else:
+        filepath = export_manager.export_to_csv(
+            results=results_with_metrics,
+            session=session,
+            include_abstracts=include_abstracts,
+        )
 
-# Initialize session state and UI
-init_session_state()
-load_custom_css()
+    if filepath is None:
+        # Raise rather than return so a failed export is not cached
+        raise RuntimeError("Failed to generate export file")
 
-setup_sidebar()
+    return filepath.name, str(filepath), filepath.stat().st_size
 
 
 def show_export_page() -> None:
@@ -98,18 +169,12 @@ def show_export_page() -> None:
         st.subheader("Export Preview")
 
         # Show export summary
+        # Counts are maintained in session state when the results are stored
         if st.session_state.search_results:
-            total_publications = sum(
-                len(result.publications) for result in st.session_state.search_results
-            )
-            successful_searches = len(
-                [r for r in st.session_state.search_results if not r.error]
-            )
-
             st.write("**Export will include:**")
-            st.write(f"• {len(st.session_state.chemicals)} chemicals")
-            st.write(f"• {successful_searches} successful searches")
-            st.write(f"• {total_publications} publications")
+            st.write(f"• {st.session_state.chemicals_count} chemicals")
+            st.write(f"• {st.session_state.successful_count} successful searches")
+            st.write(f"• {st.session_state.total_papers} publications")
             if include_abstracts:
                 st.write("• Publication abstracts")
             if include_metadata:
@@ -131,106 +196,55 @@ def show_export_page() -> None:
         )
 
         try:
-            # Initialize export manager
-            export_manager = ExportManager()
-
-            # Prepare data for export
-            status_text.text("📊 Collecting search results...")
-            progress_bar.progress(0.2)
-
             if bool(cancel_button):
                 st.warning("⏸️ Export cancelled by user")
                 progress_container.empty()
                 return
 
-            # Create session object for export
-            search_results = st.session_state.search_results
-            batch_id = st.session_state.get("current_batch_id", "unknown")
-
-            # Create search parameters from session state
-            search_params = SearchParameters(
-                date_range_years=st.session_state.settings["date_range_years"],
-                max_results=st.session_state.settings["max_results_per_chemical"],
-                include_reviews=st.session_state.settings["include_reviews"],
-                use_cache=st.session_state.settings["cache_enabled"],
-            )
-
-            # Create session object
-            session = BatchSearchSession(
-                batch_id=batch_id,
-                chemicals=st.session_state.chemicals,
-                parameters=search_params,
-                status="completed",
-            )
+            # Progress follows the real export phases: scoring the results
+            # (skipped once the batch has been scored) and writing the file
+            status_text.text("📊 Calculating quality metrics...")
+            progress_bar.progress(0.1)
+            quality_metrics = get_quality_metrics()
 
-            # Prepare results with quality metrics
-            status_text.text("📋 Calculating quality metrics...")
-            progress_bar.progress(0.4)
-
-            results_with_metrics = []
-            for result in search_results:
-                metrics = calculate_quality_metrics(result)
-                results_with_metrics.append((result, metrics))
-
-            # Generate export based on format
             status_text.text("📄 Creating export file...")
-            progress_bar.progress(0.7)
-
-            filepath: Optional[Path] = None
-            mime_type = "text/csv"
-
-            if export_format == "CSV":
-                filepath = export_manager.export_to_csv(
-                    results=results_with_metrics,
-                    session=session,
-                    include_abstracts=include_abstracts,
-                )
-                mime_type = "text/csv"
-            elif export_format == "Excel (XLSX)":
-                filepath = export_manager.export_to_excel(
-                    results=results_with_metrics,
-                    session=session,
-                    include_abstracts=include_abstracts,
-                )
-                mime_type = (
-                    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                )
-            elif export_format == "JSON":
-                filepath = export_manager.export_to_json(
-                    results=results_with_metrics, session=session
-                )
-                mime_type = "application/json"
-            else:
-                # Default to CSV if format is unexpected
-                filepath = export_manager.export_to_csv(
-                    results=results_with_metrics,
-                    session=session,
-                    include_abstracts=include_abstracts,
-                )
-                mime_type = "text/csv"
+            progress_bar.progress(0.5)
 
-            if filepath is None:
-                st.error("❌ Failed to generate export file")
-                return
+            search_results = st.session_state.search_results
+            settings = st.session_state.settings
+            export_args = (
+                st.session_state.get("current_batch_id"),
+                get_results_token(),
+                get_chemicals_token(),
+                export_format,
+                include_abstracts,
+                (
+                    settings["date_range_years"],
+                    settings["max_results_per_chemical"],
+                    settings["include_reviews"],
+                    settings["cache_enabled"],
+                ),
+                search_results,
+                quality_metrics,
+                st.session_state.chemicals,
+            )
+            file_name, file_path, file_size = _build_export(*export_args)
+            if not Path(file_path).exists():
+                # The cached export was removed from disk; drop only its entry
+                # (other batches and sessions keep theirs) and generate it again
+                _build_export.clear(*export_args)
+                file_name, file_path, file_size = _build_export(*export_args)
+            mime_type = _EXPORT_MIME_TYPES.get(export_format, "text/csv")
 
-            status_text.text("✅ Export ready!")
-            progress_bar.progress(1.0)
-            time.sleep(0.3)
             progress_container.empty()
 
-            # Read the generated file for download
-            with open(filepath, "rb") as f:
-                file_data = f.read()
-
             # Show success with real file info
-            file_size_kb = len(file_data) / 1024
+            file_size_kb = file_size / 1024
             stats = {
                 "File Size": f"{file_size_kb:.1f} KB",
-                "Chemicals": len(st.session_state.chemicals),
+                "Chemicals": st.session_state.chemicals_count,
                 "Format": export_format,
-                "Publications": sum(
-                    len(result.publications) for result, _ in results_with_metrics
-                ),
+                "Publications": st.session_state.total_papers,
             }
             show_success_with_stats(
                 "Export file generated successfully!", stats, show_balloons=False
@@ -239,8 +253,8 @@ def show_export_page() -> None:
             # Provide actual download button
             st.download_button(
                 label="📥 Download Export",
-                data=file_data,
-                file_name=filepath.name,
+                data=Path(file_path).read_bytes(),
+                file_name=file_name,
                 mime=mime_type,
             )
 
@@ -288,7 +302,4 @@ def show_export_page() -> None:
 
 
 # Main execution
-if __name__ == "__main__":
-    show_export_page()
-else:
-    show_export_page()
+show_export_page()
@@ -3,46 +3,64 @@ History page for ChemScreen multipage application.
 """
 
 import logging
-import sys
 from datetime import datetime
-from pathlib import Path
+from typing import Any
 
 import pandas as pd
 import streamlit as st
 
-# Add the project root to the path
-sys.path.append(str(Path(__file__).parent.parent))
-
 # Import ChemScreen modules
-from chemscreen.config import initialize_config
 from chemscreen.errors import show_error_with_help
-from chemscreen.session_manager import SessionManager
-from shared.app_utils import init_session_state
+from chemscreen.session_manager import get_session_manager
 
 # Import shared utilities
-from shared.ui_utils import load_custom_css, setup_sidebar
-
-# Initialize configuration and logging
-config = initialize_config()
-logging.basicConfig(
-    level=getattr(logging, config.log_level),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+from shared.session_init import store_chemicals, store_search_results
+
 logger = logging.getLogger(__name__)
 
-# Page configuration
-st.set_page_config(
-    page_title="History - ChemScreen",
-    page_icon="📜",
-    layout="wide",
-    initial_sidebar_state="expanded",
-)
+# Page title and icon (from _PAGES), layout, session state and sidebar are set up
+# by ChemScreen.py, which runs this page through st.navigation
+
+_HISTORY_COLUMN_CONFIG = {
+    "Date": st.column_config.DatetimeColumn("Date", format="YYYY-MM-DD HH:mm:ss")
+}
 
-# Initialize session state and UI
-init_session_state()
-load_custom_css()
 
-setup_sidebar()
+@st.cache_data(max_entries=8, ttl=60, show_spinner=False)
+def _load_history(index_mtime_ns: int) -> tuple[list[dict[str, Any]], pd.DataFrame]:
+    """
+    Load session metadata and build the history table.
+
+    Keyed on the session index's modification time, so saving or deleting a
+    session is picked up on the next rerun without waiting for the TTL.
+    """
+    sessions = get_session_manager().list_sessions()
+
+    history_data = []
+    for session_meta in sessions:
+        try:
+            created_at = datetime.fromisoformat(session_meta["created_at"])
+            history_data.append(
+                {
+                    "Batch ID": session_meta["session_id"],
+                    "Date": created_at,
+                    "Chemicals": session_meta["chemical_count"],
+                    "Status": "✅ Complete"
+                    if session_meta.get("status") == "completed"
+                    else "⚠️ Partial",
+                    "Results": session_meta.get("result_count", 0),
+                    "Session Name": session_meta.get("session_name", "Unnamed Session"),
+                }
+            )
+        except Exception as e:
+            logger.error(f"Error processing session metadata: {e}")
+            continue
+
+    history_df = pd.DataFrame(history_data)
+    if not history_df.empty:
+        # Low-cardinality labels are stored as integer codes
+        history_df["Status"] = history_df["Status"].astype("category")
+    return sessions, history_df
 
 
 def show_history_page() -> None:
@@ -51,11 +69,13 @@ def show_history_page() -> None:
 
     st.markdown("View and manage your previous search sessions.")
 
-    # Initialize session manager
-    session_manager = SessionManager()
+    # Shared session manager
+    session_manager = get_session_manager()
 
-    # Get session list
-    sessions = session_manager.list_sessions()
+    # Get session list and history table (cached until the index changes)
+    index_file = session_manager.index_file
+    index_mtime_ns = index_file.stat().st_mtime_ns if index_file.exists() else 0
+    sessions, history_df = _load_history(index_mtime_ns)
 
     if not sessions:
         st.info("No search history available. Run a search to create your first session.")
@@ -72,6 +92,7 @@ def show_history_page() -> None:
         if st.button("🧹 Cleanup Old Sessions"):
             deleted_count = session_manager.cleanup_old_sessions(days_to_keep=30)
             if deleted_count > 0:
+                _load_history.clear()
                 st.success(f"Deleted {deleted_count} old sessions")
                 st.rerun()
             else:
@@ -79,43 +100,19 @@ def show_history_page() -> None:
 
     with col3:
         if st.button("🔄 Refresh"):
+            _load_history.clear()
             st.rerun()
 
-    # Convert sessions to DataFrame for display
-    history_data = []
-    for session_meta in sessions:
-        try:
-            created_at = datetime.fromisoformat(session_meta["created_at"])
-            history_data.append(
-                {
-                    "Batch ID": session_meta["session_id"],
-                    "Date": created_at.strftime("%Y-%m-%d %H:%M:%S"),
-                    "Chemicals": session_meta["chemical_count"],
-                    "Status": "✅ Complete"
-                    if session_meta.get("status") == "completed"
-                    else "⚠️ Partial",
-                    "Results": session_meta.get("result_count", 0),
-                    "Session Name": session_meta.get("session_name", "Unnamed Session"),
-                }
-            )
-        except Exception as e:
-            logger.error(f"Error processing session metadata: {e}")
-            continue
-
-    if not history_data:
+    if history_df.empty:
         st.warning("No valid sessions found in history.")
         return
 
-    history_df = pd.DataFrame(history_data)
-
     # Display history table with actions
     st.dataframe(
         history_df,
         use_container_width=True,
         hide_index=True,
-        column_config={
-            "Date": st.column_config.DatetimeColumn("Date", format="YYYY-MM-DD HH:mm:ss")
-        },
+        column_config=_HISTORY_COLUMN_CONFIG,
     )
 
     # Session actions
@@ -138,10 +135,8 @@ def show_history_page() -> None:
                 loaded_session = session_manager.load_session(selected_session_id)
                 if loaded_session:
                     st.session_state.current_session = loaded_session
-                    st.session_state.chemicals = loaded_session.chemicals
-                    st.session_state.search_results = list(
-                        loaded_session.results.values()
-                    )
+                    store_chemicals(loaded_session.chemicals)
+                    store_search_results(list(loaded_session.results.values()))
                     st.session_state.current_batch_id = loaded_session.batch_id
 
                     # Update search parameters in session state
@@ -170,6 +165,7 @@ def show_history_page() -> None:
         with col2:
             if st.button("🗑️ Delete Session"):
                 if session_manager.delete_session(selected_session_id):
+                    _load_history.clear()
                     st.success(f"Session {selected_session_id} deleted")
                     st.rerun()
                 else:
@@ -205,7 +201,4 @@ def show_history_page() -> None:
 
 
 # Main execution
-if __name__ == "__main__":
-    show_history_page()
-else:
-    show_history_page()
+show_history_page()
@@ -1,63 +1,83 @@
 """
 Application utilities for ChemScreen multipage application.
 
-Contains functions for session state management, demo data loading, and other app utilities.
+Contains functions for session resets, demo data loading, and other app utilities.
 """
 
 import logging
-import sys
-import time
 from pathlib import Path
 
 import pandas as pd
 import streamlit as st
 
-# Add the chemscreen package to the path
-sys.path.append(str(Path(__file__).parent.parent))
-
-from chemscreen.cached_processors import cached_process_csv_data
-from chemscreen.config import initialize_config
 from chemscreen.errors import (
     log_error_for_support,
     show_error_with_help,
 )
-from chemscreen.models import CSVColumnMapping
-
-logger = logging.getLogger(__name__)
+from chemscreen.models import CSVColumnMapping, CSVUploadResult
+from chemscreen.processor import process_csv_data
 
+from .session_init import store_chemicals
 
-def init_session_state() -> None:
-    """Initialize session state variables."""
-    config = initialize_config()
-
-    if "chemicals" not in st.session_state:
-        st.session_state.chemicals = []
-    if "search_results" not in st.session_state:
-        st.session_state.search_results = {}
-    if "current_batch_id" not in st.session_state:
-        st.session_state.current_batch_id = None
-    if "search_history" not in st.session_state:
-        st.session_state.search_history = []
-    if "settings" not in st.session_state:
-        st.session_state.settings = {
-            "date_range_years": config.default_date_range_years,
-            "max_results_per_chemical": config.max_results_per_chemical,
-            "include_reviews": config.default_include_reviews,
-            "cache_enabled": config.cache_enabled,
-            "max_batch_size": config.max_batch_size,
-        }
+logger = logging.getLogger(__name__)
 
 
 def reset_session() -> None:
     """Reset session state to start over."""
     st.session_state.chemicals = []
+    st.session_state.chemicals_count = 0
+    st.session_state.chemicals_token = None
     st.session_state.search_results = {}
+    st.session_state.total_results = 0
+    st.session_state.successful_count = 0
+    st.session_state.total_papers = 0
+    st.session_state.quality_metrics = None
+    st.session_state.results_token = None
     st.session_state.current_batch_id = None
     # Keep search history and settings
     st.success("✅ Session reset! You can now upload a new file.")
     st.rerun()
 
 
+# Demo datasets by size and the column layout they share
+_DEMO_DIR = Path(__file__).parent.parent / "data" / "raw"
+_DEMO_FILES = {
+    "small": "demo_small.csv",
+    "medium": "demo_medium.csv",
+    "large": "demo_large.csv",
+}
+_DEMO_COLUMN_MAPPING = CSVColumnMapping(
+    name_column="chemical_name",
+    cas_column="cas_number",
+    synonyms_column="synonyms",
+    notes_column="notes",
+)
+
+
+_DEMO_CACHE_TTL = 24 * 60 * 60  # seconds
+
+
+@st.cache_data(show_spinner=False, max_entries=len(_DEMO_FILES), ttl=_DEMO_CACHE_TTL)
+def _read_demo_file(demo_file_path: str, mtime_ns: int) -> pd.DataFrame:
+    """
+    Read a demo CSV file once and share it across reruns and sessions.
+
+    The modification time is part of the cache key so an edited demo file
+    is picked up without restarting the server. Parsed with PyArrow's
+    multithreaded reader (installed with Streamlit), like uploads, so
+    missing cells come back as None in both.
+    """
+    return pd.read_csv(demo_file_path, engine="pyarrow")
+
+
+@st.cache_data(show_spinner=False, max_entries=len(_DEMO_FILES), ttl=_DEMO_CACHE_TTL)
+def _process_demo_file(demo_file_path: str, mtime_ns: int) -> CSVUploadResult:
+    """Process a demo CSV file, keyed on its path and mtime rather than its contents."""
+    return process_csv_data(
+        _read_demo_file(demo_file_path, mtime_ns), _DEMO_COLUMN_MAPPING
+    )
+
+
 def load_demo_data(size: str) -> None:
     """Load demo dataset into session state.
 
@@ -65,22 +85,15 @@ def load_demo_data(size: str) -> None:
         size: One of 'small', 'medium', or 'large'
     """
     try:
-        # Map size to filename
-        size_map = {
-            "small": "demo_small.csv",
-            "medium": "demo_medium.csv",
-            "large": "demo_large.csv",
-        }
-
-        if size not in size_map:
+        if size not in _DEMO_FILES:
             show_error_with_help(
                 "invalid_parameter",
-                f"Invalid demo size '{size}'. Available sizes: {', '.join(size_map.keys())}",
+                f"Invalid demo size '{size}'. Available sizes: {', '.join(_DEMO_FILES.keys())}",
             )
             return
 
         # Load the demo file
-        demo_file_path = Path(__file__).parent.parent / "data" / "raw" / size_map[size]
+        demo_file_path = _DEMO_DIR / _DEMO_FILES[size]
 
         if not demo_file_path.exists():
             show_error_with_help(
@@ -91,8 +104,9 @@ def load_demo_data(size: str) -> None:
             logger.error(f"Demo file not found: {demo_file_path}")
             return
 
-        # Read the CSV file
-        demo_data = pd.read_csv(demo_file_path)
+        # Read the CSV file (cached across clicks and sessions until it changes)
+        demo_mtime_ns = demo_file_path.stat().st_mtime_ns
+        demo_data = _read_demo_file(str(demo_file_path), demo_mtime_ns)
 
         if demo_data.empty:
             show_error_with_help(
@@ -100,46 +114,14 @@ def load_demo_data(size: str) -> None:
             )
             return
 
-        # Create column mapping for demo data
-        column_mapping = CSVColumnMapping(
-            name_column="chemical_name",
-            cas_column="cas_number",
-            synonyms_column="synonyms",
-            notes_column="notes",
-        )
-
-        # Process the demo data with enhanced loading states
-        with st.spinner(f"Loading {size} demo dataset..."):
-            # Show detailed progress
-            progress_container = st.container()
-            with progress_container:
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-
-                status_text.text("📂 Reading demo file...")
-                progress_bar.progress(0.2)
-                time.sleep(0.2)
-
-                status_text.text("🔍 Processing chemical data...")
-                progress_bar.progress(0.4)
-
-                result = cached_process_csv_data(demo_data, column_mapping)
-
-                status_text.text("✅ Validating chemicals...")
-                progress_bar.progress(0.8)
-                time.sleep(0.2)
-
-                status_text.text("✨ Demo data ready!")
-                progress_bar.progress(1.0)
-                time.sleep(0.3)
-                progress_container.empty()
-
-            if result.valid_chemicals:
-                st.session_state.chemicals = result.valid_chemicals
+        # Process the demo data (cached, so repeat clicks return immediately)
+        with st.status(f"Loading {size} demo dataset...", expanded=False) as status:
+            result = _process_demo_file(str(demo_file_path), demo_mtime_ns)
+            status.update(label="✨ Demo data ready!", state="complete")
 
         # Store demo loading result in session state for main area display
         if result.valid_chemicals:
-            st.session_state.chemicals = result.valid_chemicals
+            store_chemicals(result.valid_chemicals)
             st.session_state.demo_load_result = {
                 "size": size,
                 "valid_count": len(result.valid_chemicals),
@@ -0,0 +1,140 @@
+"""
+Session state initialization for ChemScreen multipage application.
+
+Kept separate from app_utils so that the entrypoint can set up session state
+without importing the CSV processing and demo data pipeline.
+"""
+
+from typing import TYPE_CHECKING, Optional
+from uuid import uuid4
+
+import streamlit as st
+
+from chemscreen.config import get_config
+
+if TYPE_CHECKING:
+    from chemscreen.models import Chemical, QualityMetrics, SearchResult
+
+
+def init_session_state() -> None:
+    """Initialize session state variables."""
+    config = get_config()
+
+    if "chemicals" not in st.session_state:
+        st.session_state.chemicals = []
+    if "chemicals_count" not in st.session_state:
+        st.session_state.chemicals_count = 0
+    if "chemicals_token" not in st.session_state:
+        st.session_state.chemicals_token = None
+    if "search_results" not in st.session_state:
+        st.session_state.search_results = {}
+    if "total_results" not in st.session_state:
+        st.session_state.total_results = 0
+    if "successful_count" not in st.session_state:
+        st.session_state.successful_count = 0
+    if "total_papers" not in st.session_state:
+        st.session_state.total_papers = 0
+    if "quality_metrics" not in st.session_state:
+        st.session_state.quality_metrics = None
+    if "results_token" not in st.session_state:
+        st.session_state.results_token = None
+    if "current_batch_id" not in st.session_state:
+        st.session_state.current_batch_id = None
+    if "search_history" not in st.session_state:
+        st.session_state.search_history = []
+    if "settings" not in st.session_state:
+        st.session_state.settings = {
+            "date_range_years": config.default_date_range_years,
+            "max_results_per_chemical": config.max_results_per_chemical,
+            "include_reviews": config.default_include_reviews,
+            "cache_enabled": config.cache_enabled,
+            "max_batch_size": config.max_batch_size,
+            "max_concurrent_searches": config.concurrent_requests,
+        }
+
+
+def store_chemicals(chemicals: list["Chemical"]) -> None:
+    """Store the loaded chemicals and update their count in session state.
+
+    Args:
+        chemicals: Validated chemicals for the current session
+    """
+    st.session_state.chemicals = chemicals
+    st.session_state.chemicals_count = len(chemicals)
+    # New on every store, so caches keyed on it never serve stale chemicals
+    st.session_state.chemicals_token = uuid4().hex
+
+
+def store_search_results(results: list["SearchResult"]) -> None:
+    """Store search results and update the derived counters in session state.
+
+    Counters are maintained here so that pages can read them in constant time
+    instead of re-scanning the result list on every rerun.
+
+    Args:
+        results: Search results for the current batch
+    """
+    st.session_state.search_results = results
+    st.session_state.total_results = len(results)
+    st.session_state.successful_count = sum(not r.error for r in results)
+    st.session_state.total_papers = sum(len(r.publications) for r in results)
+    # Computed on first use by get_quality_metrics
+    st.session_state.quality_metrics = None
+    # New on every store, so caches keyed on it never serve stale results
+    st.session_state.results_token = uuid4().hex
+
+
+def get_quality_metrics() -> list["QualityMetrics"]:
+    """Return the quality metrics for the stored search results.
+
+    The metrics are calculated once per stored batch and kept in session
+    state alongside the results, in the same order, so pages reuse them
+    instead of recalculating them on every rerun.
+
+    Returns:
+        Quality metrics for each search result
+    """
+    metrics: Optional[list["QualityMetrics"]] = st.session_state.get("quality_metrics")
+    if metrics is None:
+        from chemscreen.analyzer import calculate_quality_metrics
+
+        metrics = [
+            calculate_quality_metrics(result)
+            for result in st.session_state.search_results
+        ]
+        st.session_state.quality_metrics = metrics
+    return metrics
+
+
+def _get_token(key: str) -> str:
+    """Return the session state token under key, creating it if unset."""
+    token: Optional[str] = st.session_state.get(key)
+    if token is None:
+        token = uuid4().hex
+        st.session_state[key] = token
+    return token
+
+
+def get_results_token() -> str:
+    """Return the token identifying the stored search results.
+
+    A fresh token is generated by every call to store_search_results, so it
+    is unique to one session's copy of one set of results. Caches shared
+    across sessions are keyed on it rather than on the batch ID, which is
+    not unique for sessions without a batch or loaded from History.
+
+    Returns:
+        Token for the current search results
+    """
+    return _get_token("results_token")
+
+
+def get_chemicals_token() -> str:
+    """Return the token identifying the stored chemicals.
+
+    Regenerated by every call to store_chemicals, like get_results_token.
+
+    Returns:
+        Token for the current chemicals
+    """
+    return _get_token("chemicals_token")
@@ -5,29 +5,22 @@ Contains functions for CSS styling, sidebar setup, and other UI components.
 """
 
 import re
-import sys
-from pathlib import Path
+from string import Template
 from typing import Any, Tuple
 
 import streamlit as st
 
-# Add the chemscreen package to the path
-sys.path.append(str(Path(__file__).parent.parent))
+from chemscreen.config import get_config
 
-from chemscreen.config import initialize_config
+# Largest batch that still gets the celebration animation; bigger batches skip it
+BALLOONS_MAX_BATCH_SIZE = 50
 
+# Accepted theme colors; anything else falls back to the default to prevent CSS injection
+_HEX_COLOR_RE = re.compile(r"^#([A-Fa-f0-9]{6}|[A-Fa-f0-9]{3})$")
+_DEFAULT_PRIMARY_COLOR = "#0066CC"
 
-def load_custom_css() -> None:
-    """Load custom CSS styles."""
-    config = initialize_config()
-
-    # Sanitize the primary color to prevent CSS injection
-    primary_color = config.theme_primary_color
-    if not re.match(r"^#([A-Fa-f0-9]{6}|[A-Fa-f0-9]{3})$", primary_color):
-        primary_color = "#0066CC"  # Fallback to a safe default
-
-    st.markdown(
-        """
+# Custom stylesheet; $primary_color is substituted with the sanitized theme color
+_CSS_TEMPLATE = Template("""
     <style>
     /* Main container styling */
     .main {
@@ -36,9 +29,7 @@ def load_custom_css() -> None:
 
     /* Header styling */
     .stApp h1 {
-        color: """
-        + primary_color
-        + """;
+        color: $primary_color;
         padding-bottom: 1rem;
         border-bottom: 2px solid #e0e0e0;
         margin-bottom: 2rem;
@@ -51,9 +42,7 @@ def load_custom_css() -> None:
 
     /* Button styling */
     .stButton > button {
-        background-color: """
-        + primary_color
-        + """;
+        background-color: $primary_color;
         color: white;
         border: none;
         padding: 0.5rem 1rem;
@@ -97,9 +86,7 @@ def load_custom_css() -> None:
 
     /* Progress bar custom styling */
     .stProgress > div > div > div > div {
-        background-color: """
-        + primary_color
-        + """;
+        background-color: $primary_color;
     }
 
     /* Table styling */
@@ -115,119 +102,162 @@ def load_custom_css() -> None:
         text-align: center;
     }
     </style>
-    """,
-        unsafe_allow_html=True,
-    )
+    """)
+
+
+def load_custom_css() -> None:
+    """Load custom CSS styles.
+
+    The stylesheet is sanitized, built and cached once per primary color,
+    but it is emitted on every run: Streamlit drops elements that are not
+    re-rendered, so skipping the markdown call would remove the styling.
+    """
+    st.markdown(_build_css(get_config().theme_primary_color), unsafe_allow_html=True)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _build_css(primary_color: str) -> str:
+    """Build the custom stylesheet, falling back to the default for invalid colors."""
+    if not _HEX_COLOR_RE.match(primary_color):
+        primary_color = _DEFAULT_PRIMARY_COLOR
+    return _CSS_TEMPLATE.substitute(primary_color=primary_color)
 
 
 def setup_sidebar() -> None:
     """Configure the sidebar with settings and status (without navigation)."""
-
     with st.sidebar:
-        # Quick Settings
-        st.subheader("⚙️ Quick Settings")
+        _render_sidebar()
 
-        with st.expander("Search Settings", expanded=False):
-            st.session_state.settings["date_range_years"] = st.slider(
+
+@st.fragment
+def _render_sidebar() -> None:
+    """Render the sidebar contents.
+
+    Runs as a fragment so that interacting with sidebar widgets only reruns
+    the sidebar instead of the whole page.
+    """
+    # Quick Settings
+    st.subheader("⚙️ Quick Settings")
+
+    with st.expander("Search Settings", expanded=False):
+        # Batch the settings in a form so adjusting them doesn't rerun on every change
+        settings = st.session_state.settings
+        with st.form("settings_form", border=False):
+            date_range_years = st.slider(
                 "Date Range (years)",
                 min_value=1,
                 max_value=20,
-                value=st.session_state.settings["date_range_years"],
+                value=settings["date_range_years"],
                 help="Search for publications from the last N years",
             )
 
-            st.session_state.settings["max_results_per_chemical"] = st.number_input(
+            max_results_per_chemical = st.number_input(
                 "Max Results per Chemical",
                 min_value=10,
                 max_value=10000,
-                value=st.session_state.settings["max_results_per_chemical"],
+                value=settings["max_results_per_chemical"],
                 step=10,
                 help="Maximum number of results to retrieve per chemical",
             )
 
-            st.session_state.settings["include_reviews"] = st.checkbox(
+            include_reviews = st.checkbox(
                 "Include Review Articles",
-                value=st.session_state.settings["include_reviews"],
+                value=settings["include_reviews"],
                 help="Include review articles in search results",
             )
 
-            st.session_state.settings["cache_enabled"] = st.checkbox(
+            cache_enabled = st.checkbox(
                 "Enable Caching",
-                value=st.session_state.settings["cache_enabled"],
+                value=settings["cache_enabled"],
                 help="Cache search results to speed up repeated searches",
             )
 
-        st.markdown("---")
+            if st.form_submit_button("Apply", use_container_width=True):
+                new_settings = {
+                    "date_range_years": date_range_years,
+                    "max_results_per_chemical": max_results_per_chemical,
+                    "include_reviews": include_reviews,
+                    "cache_enabled": cache_enabled,
+                }
+                # Only changed settings need the whole app rerun so pages pick
+                # them up; an unchanged Apply stays a sidebar-only rerun
+                if any(settings[k] != v for k, v in new_settings.items()):
+                    settings.update(new_settings)
+                    st.rerun()
+
+    st.markdown("---")
+
+    # Status Information
+    st.subheader("📈 Current Status")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Chemicals", st.session_state.chemicals_count)
+    with col2:
+        st.metric("Results", st.session_state.total_results)
+
+    # Session info
+    if st.session_state.current_batch_id:
+        st.info(f"Batch ID: {st.session_state.current_batch_id}")
+
+    st.markdown("---")
+
+    # Demo Data Quick Access
+    st.subheader("📊 Demo Data")
+
+    demo_col1, demo_col2 = st.columns(2)
+
+    with demo_col1:
+        if st.button(
+            "Small (10)",
+            help="Load 10 demo chemicals",
+            use_container_width=True,
+            key="sidebar_small",
+        ):
+            from .app_utils import load_demo_data
 
-        # Status Information
-        st.subheader("📈 Current Status")
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("Chemicals", len(st.session_state.chemicals))
-        with col2:
-            st.metric("Results", len(st.session_state.search_results))
+            load_demo_data("small")
 
-        # Session info
-        if st.session_state.current_batch_id:
-            st.info(f"Batch ID: {st.session_state.current_batch_id}")
+    with demo_col2:
+        if st.button(
+            "Medium (50)",
+            help="Load 50 demo chemicals",
+            use_container_width=True,
+            key="sidebar_medium",
+        ):
+            from .app_utils import load_demo_data
 
-        st.markdown("---")
+            load_demo_data("medium")
 
-        # Demo Data Quick Access
-        st.subheader("📊 Demo Data")
+    if st.button(
+        "Large (150)",
+        help="Load 150 demo chemicals with edge cases",
+        use_container_width=True,
+        key="sidebar_large",
+    ):
         from .app_utils import load_demo_data
 
-        demo_col1, demo_col2 = st.columns(2)
-
-        with demo_col1:
-            if st.button(
-                "Small (10)",
-                help="Load 10 demo chemicals",
-                use_container_width=True,
-                key="sidebar_small",
-            ):
-                load_demo_data("small")
-
-        with demo_col2:
-            if st.button(
-                "Medium (50)",
-                help="Load 50 demo chemicals",
-                use_container_width=True,
-                key="sidebar_medium",
-            ):
-                load_demo_data("medium")
+        load_demo_data("large")
 
+    st.markdown("---")
+
+    # Reset functionality
+    if st.session_state.chemicals_count > 0 or st.session_state.total_results > 0:
+        st.subheader("🔄 Reset")
         if st.button(
-            "Large (150)",
-            help="Load 150 demo chemicals with edge cases",
+            "🗑️ Clear All Data",
+            help="Clear uploaded chemicals and search results to start over",
             use_container_width=True,
-            key="sidebar_large",
+            type="secondary",
         ):
-            load_demo_data("large")
+            from .app_utils import reset_session
 
-        st.markdown("---")
+            reset_session()
 
-        # Reset functionality
-        if (
-            len(st.session_state.chemicals) > 0
-            or len(st.session_state.search_results) > 0
-        ):
-            st.subheader("🔄 Reset")
-            if st.button(
-                "🗑️ Clear All Data",
-                help="Clear uploaded chemicals and search results to start over",
-                use_container_width=True,
-                type="secondary",
-            ):
-                from .app_utils import reset_session
+    st.markdown("---")
 
-                reset_session()
-
-        st.markdown("---")
-
-        # Footer
-        st.caption("ChemScreen Prototype v1.0")
-        st.caption("© 2025 - For Research Use Only")
+    # Footer
+    st.caption("ChemScreen Prototype v1.0")
+    st.caption("© 2025 - For Research Use Only")
 
 
 def create_progress_with_cancel(
@@ -278,6 +308,39 @@ def show_success_with_stats(
         st.balloons()
 
 
+def paginate(total_rows: int, rows_per_page: int, key: str) -> tuple[int, int]:
+    """
+    Show a page selector and return the row window for the selected page.
+
+    Only the returned window needs to be rendered, so the payload sent to the
+    browser stays bounded by rows_per_page however long the list is.
+
+    Args:
+        total_rows: Number of rows being paged through
+        rows_per_page: Rows shown per page
+        key: Widget key for the page selector
+
+    Returns:
+        Tuple of (start, end) row indices for slicing
+    """
+    if total_rows <= rows_per_page:
+        return 0, total_rows
+
+    total_pages = (total_rows + rows_per_page - 1) // rows_per_page
+    page = st.number_input(
+        f"Page (of {total_pages})",
+        min_value=1,
+        max_value=total_pages,
+        value=1,
+        step=1,
+        key=key,
+    )
+    start = (int(page) - 1) * rows_per_page
+    end = min(start + rows_per_page, total_rows)
+    st.caption(f"Showing rows {start + 1:,} - {end:,} of {total_rows:,}")
+    return start, end
+
+
 def show_help_tooltip(title: str, content: str, icon: str = "💡") -> None:
     """
     Show a help tooltip with consistent styling.
@@ -291,20 +354,11 @@ def show_help_tooltip(title: str, content: str, icon: str = "💡") -> None:
         st.markdown(content)
 
 
-def get_feature_help(feature: str) -> dict[str, str]:
-    """
-    Get help content for specific features.
-
-    Args:
-        feature: Name of the feature
-
-    Returns:
-        Dict with 'title', 'content', and 'icon' keys
-    """
-    help_content = {
-        "csv_upload": {
-            "title": "CSV Upload Tips",
-            "content": """
+# Help content for each feature, keyed by feature name
+_FEATURE_HELP: dict[str, dict[str, str]] = {
+    "csv_upload": {
+        "title": "CSV Upload Tips",
+        "content": """
 **Required Format:**
 - CSV file with headers
 - At least one column with chemical names or CAS numbers
@@ -321,12 +375,12 @@ def get_feature_help(feature: str) -> dict[str, str]:
 - Use standard chemical names when possible
 - Keep file size under 10MB
 - Maximum 200 chemicals per batch
-            """,
-            "icon": "📤",
-        },
-        "column_mapping": {
-            "title": "Column Mapping Guide",
-            "content": """
+        """,
+        "icon": "📤",
+    },
+    "column_mapping": {
+        "title": "Column Mapping Guide",
+        "content": """
 **Auto-Detection:**
 The system tries to automatically detect your columns based on common names like:
 - "chemical_name", "name", "compound"
@@ -340,12 +394,12 @@ If auto-detection fails, select the correct columns manually:
 **Requirements:**
 - At least ONE column must be selected (name OR CAS)
 - Both columns can be selected for better results
-            """,
-            "icon": "🔗",
-        },
-        "search_settings": {
-            "title": "Search Settings Explained",
-            "content": """
+        """,
+        "icon": "🔗",
+    },
+    "search_settings": {
+        "title": "Search Settings Explained",
+        "content": """
 **Date Range:**
 - Limits search to publications from recent years
 - Shorter ranges = faster searches, fewer results
@@ -364,12 +418,12 @@ If auto-detection fails, select the correct columns manually:
 - Saves previous search results
 - Dramatically speeds up repeated searches
 - Safe to keep enabled
-            """,
-            "icon": "⚙️",
-        },
-        "batch_processing": {
-            "title": "Batch Processing Info",
-            "content": """
+        """,
+        "icon": "⚙️",
+    },
+    "batch_processing": {
+        "title": "Batch Processing Info",
+        "content": """
 **Performance:**
 - Each chemical takes ~30 seconds to search
 - 100 chemicals ≈ 50 minutes total time
@@ -384,12 +438,12 @@ If auto-detection fails, select the correct columns manually:
 - Start with smaller batches (10-50 chemicals)
 - Monitor progress during searches
 - Use cache to avoid re-searching
-            """,
-            "icon": "⚡",
-        },
-        "quality_scoring": {
-            "title": "Quality Scoring System",
-            "content": """
+        """,
+        "icon": "⚡",
+    },
+    "quality_scoring": {
+        "title": "Quality Scoring System",
+        "content": """
 **Scoring Factors:**
 - Journal impact factor
 - Publication date (newer = higher score)
@@ -407,16 +461,26 @@ If auto-detection fails, select the correct columns manually:
 - Use scores to prioritize which papers to review first
 - Don't exclude lower-scored papers entirely
 - Consider context of your specific needs
-            """,
-            "icon": "📊",
-        },
-    }
+        """,
+        "icon": "📊",
+    },
+}
 
-    return help_content.get(
-        feature,
-        {
-            "title": "Help",
-            "content": "Help content not available for this feature.",
-            "icon": "❓",
-        },
-    )
+_DEFAULT_FEATURE_HELP = {
+    "title": "Help",
+    "content": "Help content not available for this feature.",
+    "icon": "❓",
+}
+
+
+def get_feature_help(feature: str) -> dict[str, str]:
+    """
+    Get help content for specific features.
+
+    Args:
+        feature: Name of the feature
+
+    Returns:
+        Dict with 'title', 'content', and 'icon' keys
+    """
+    return _FEATURE_HELP.get(feature, _DEFAULT_FEATURE_HELP)
@@ -1,6 +1,11 @@
 """Tests for CSV processing functionality."""
 
+from io import BytesIO
+from unittest.mock import patch
+
 import pandas as pd
+import pyarrow as pa
+import pytest
 
 from chemscreen.models import Chemical, CSVColumnMapping
 from chemscreen.processor import (
@@ -8,8 +13,10 @@ from chemscreen.processor import (
     expand_abbreviations,
     merge_duplicates,
     process_csv_data,
+    read_csv_limited,
     standardize_chemical_name,
     suggest_column_mapping,
+    suggest_column_mapping_from_columns,
     validate_cas_number,
     validate_csv_file,
 )
@@ -198,6 +205,25 @@ class TestDuplicateDetection:
         assert len(duplicates) == 1
         assert duplicates[0] == (0, 1)  # Case-insensitive match
 
+    def test_detect_duplicates_unique_list(self):
+        """Test that a list without repeated names or CAS numbers has no duplicates."""
+        chemicals = [
+            Chemical(name="Benzene", cas_number="71-43-2"),
+            Chemical(name="Toluene", cas_number="108-88-3"),
+            Chemical(name="Xylene"),
+        ]
+
+        assert detect_duplicates(chemicals) == []
+
+    def test_detect_duplicates_same_name_different_cas(self):
+        """Test that a repeated name is still reported when CAS numbers differ."""
+        chemicals = [
+            Chemical(name="Benzene", cas_number="71-43-2"),
+            Chemical(name="benzene", cas_number="108-88-3"),
+        ]
+
+        assert detect_duplicates(chemicals) == [(0, 1)]
+
     def test_merge_duplicates(self):
         """Test duplicate merging."""
         chemicals = [
@@ -211,6 +237,22 @@ class TestDuplicateDetection:
         assert merged[0].name == "Benzene"
         assert merged[1].name == "Toluene"
 
+    def test_process_csv_records_duplicates(self):
+        """Test processing records duplicates for reuse when merging."""
+        df = pd.DataFrame(
+            {
+                "Name": ["Benzene", "Benzol", "Toluene"],
+                "CAS": ["71-43-2", "71-43-2", "108-88-3"],
+            }
+        )
+        mapping = CSVColumnMapping(name_column="Name", cas_column="CAS")
+        result = process_csv_data(df, mapping)
+
+        assert result.duplicates == [(0, 1)]
+
+        merged = merge_duplicates(result.valid_chemicals, result.duplicates)
+        assert [c.name for c in merged] == ["Benzene", "Toluene"]
+
 
 class TestCSVValidation:
     """Test CSV file validation."""
@@ -244,6 +286,166 @@ class TestCSVValidation:
         assert error is not None
 
 
+class TestChunkedCSVReading:
+    """Test bounded, chunked CSV reading."""
+
+    def test_reads_all_rows_under_limit(self):
+        """Test files within the limit are read completely."""
+        csv_content = "Name,CAS\nBenzene,71-43-2\nToluene,108-88-3"
+        df, total_rows = read_csv_limited(BytesIO(csv_content.encode()), max_rows=10)
+
+        assert total_rows == 2
+        assert df["Name"].tolist() == ["Benzene", "Toluene"]
+        assert df.index.tolist() == [0, 1]
+
+    def test_counts_rows_beyond_limit(self):
+        """Test rows past the limit are counted but not kept."""
+        rows = "\n".join(f"Chemical {i},50-00-0" for i in range(25))
+        df, total_rows = read_csv_limited(
+            BytesIO(f"Name,CAS\n{rows}".encode()), max_rows=10
+        )
+
+        assert total_rows == 25
+        assert len(df) == 10
+        assert df["Name"].iloc[-1] == "Chemical 9"
+
+    def test_counts_rows_beyond_limit_small_blocks(self):
+        """Test the row limit holds when the file spans many blocks."""
+        rows = "\n".join(f"Chemical {i},50-00-0" for i in range(25))
+        df, total_rows = read_csv_limited(
+            BytesIO(f"Name,CAS\n{rows}".encode()), max_rows=10, block_size=64
+        )
+
+        assert total_rows == 25
+        assert df["Name"].tolist() == [f"Chemical {i}" for i in range(10)]
+
+    def test_stops_counting_past_limit(self):
+        """Test count_all=False stops reading once the limit is exceeded."""
+        rows = "\n".join(f"Chemical {i},50-00-0" for i in range(25))
+        df, total_rows = read_csv_limited(
+            BytesIO(f"Name,CAS\n{rows}".encode()),
+            max_rows=10,
+            block_size=64,
+            count_all=False,
+        )
+
+        assert 10 < total_rows < 25
+        assert df["Name"].tolist() == [f"Chemical {i}" for i in range(10)]
+
+    def test_missing_values_are_filtered(self):
+        """Test missing cells read as nulls are skipped by processing."""
+        csv_content = "Name,CAS\nBenzene,\n,108-88-3\nNA,null"
+        df, _ = read_csv_limited(BytesIO(csv_content.encode()), max_rows=10)
+        result = process_csv_data(
+            df, CSVColumnMapping(name_column="Name", cas_column="CAS")
+        )
+
+        assert [c.name for c in result.valid_chemicals] == [
+            "Benzene",
+            "Chemical with CAS 108-88-3",
+        ]
+        assert result.valid_chemicals[0].cas_number is None
+
+    def test_empty_file_raises_empty_data_error(self):
+        """Test a file without a header raises pandas' EmptyDataError."""
+        with pytest.raises(pd.errors.EmptyDataError):
+            read_csv_limited(BytesIO(b""), max_rows=10)
+
+    def test_header_only_csv(self):
+        """Test a header-only file yields an empty frame with its columns."""
+        df, total_rows = read_csv_limited(BytesIO(b"Name,CAS\n"), max_rows=10)
+
+        assert total_rows == 0
+        assert df.empty
+        assert df.columns.tolist() == ["Name", "CAS"]
+
+    def test_pandas_fallback_reads_in_chunks(self):
+        """Test the pandas reader used when PyArrow rejects a file."""
+        rows = "\n".join(f"Chemical {i},50-00-0" for i in range(25))
+        with patch(
+            "chemscreen.processor._read_csv_limited_arrow",
+            side_effect=pa.ArrowInvalid("CSV parse error"),
+        ):
+            df, total_rows = read_csv_limited(
+                BytesIO(f"Name,CAS\n{rows}".encode()), max_rows=10, chunksize=4
+            )
+
+        assert total_rows == 25
+        assert df["Name"].tolist() == [f"Chemical {i}" for i in range(10)]
+        assert df.index.tolist() == list(range(10))
+
+    def test_pandas_fallback_stops_counting_past_limit(self):
+        """Test count_all=False also stops the pandas reader early."""
+        rows = "\n".join(f"Chemical {i},50-00-0" for i in range(25))
+        with patch(
+            "chemscreen.processor._read_csv_limited_arrow",
+            side_effect=pa.ArrowInvalid("CSV parse error"),
+        ):
+            df, total_rows = read_csv_limited(
+                BytesIO(f"Name,CAS\n{rows}".encode()),
+                max_rows=10,
+                chunksize=4,
+                count_all=False,
+            )
+
+        assert total_rows == 12
+        assert df["Name"].tolist() == [f"Chemical {i}" for i in range(10)]
+
+    def test_row_missing_trailing_field(self):
+        """Test a short row is padded with nulls instead of rejecting the file."""
+        csv_content = "Name,CAS\nBenzene\nToluene,108-88-3"
+        df, total_rows = read_csv_limited(BytesIO(csv_content.encode()), max_rows=10)
+
+        assert total_rows == 2
+        assert df["Name"].tolist() == ["Benzene", "Toluene"]
+        assert pd.isna(df["CAS"].iloc[0])
+        assert df["CAS"].iloc[1] == "108-88-3"
+
+    def test_ragged_row_past_first_block(self):
+        """Test a short row in a later block still falls back to pandas."""
+        rows = "\n".join(f"Chemical {i},50-00-0" for i in range(25))
+        df, total_rows = read_csv_limited(
+            BytesIO(f"Name,CAS\n{rows}\nBenzene".encode()), max_rows=10, block_size=64
+        )
+
+        assert total_rows == 26
+        assert df["Name"].tolist() == [f"Chemical {i}" for i in range(10)]
+
+    def test_row_with_extra_fields(self):
+        """Test rows with extra fields are read the way pandas reads them."""
+        csv_content = "Name,CAS\nBenzene,71-43-2,extra\nToluene,108-88-3"
+        df, total_rows = read_csv_limited(BytesIO(csv_content.encode()), max_rows=10)
+        expected = pd.read_csv(BytesIO(csv_content.encode()), dtype=str)
+
+        assert total_rows == 2
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_duplicate_headers_are_renamed(self):
+        """Test duplicate column names get pandas' numbered suffixes."""
+        csv_content = "Name,Name,Name.1,Name\na,b,c,d"
+        df, _ = read_csv_limited(BytesIO(csv_content.encode()), max_rows=10)
+
+        assert df.columns.tolist() == ["Name", "Name.2", "Name.1", "Name.3"]
+        assert df.iloc[0].tolist() == ["a", "b", "c", "d"]
+
+    def test_blank_headers_are_named(self):
+        """Test blank column names become pandas' "Unnamed: N" names."""
+        csv_content = ",CAS,\na,b,c"
+        df, _ = read_csv_limited(BytesIO(csv_content.encode()), max_rows=10)
+
+        assert df.columns.tolist() == ["Unnamed: 0", "CAS", "Unnamed: 2"]
+        assert df.iloc[0].tolist() == ["a", "b", "c"]
+
+    def test_plain_headers_skip_pandas(self):
+        """Test unique, non-blank headers are named from the Arrow schema alone."""
+        csv_content = "Name,CAS\nAspirin,50-78-2"
+        with patch("chemscreen.processor.pd.read_csv") as read_csv:
+            df, _ = read_csv_limited(BytesIO(csv_content.encode()), max_rows=10)
+
+        read_csv.assert_not_called()
+        assert df.columns.tolist() == ["Name", "CAS"]
+
+
 class TestColumnMapping:
     """Test column mapping suggestion."""
 
@@ -280,3 +482,16 @@ class TestColumnMapping:
         assert mapping.cas_column == "cas"
         assert mapping.synonyms_column == "SYNONYMS"
         assert mapping.notes_column == "Notes"
+
+    def test_suggest_from_column_names(self):
+        """Test suggestion from a tuple of column names without a DataFrame."""
+        mapping = suggest_column_mapping_from_columns(("Substance", "CAS_No", "id"))
+        assert mapping.name_column == "Substance"
+        assert mapping.cas_column == "CAS_No"
+        assert mapping.synonyms_column is None
+        assert mapping.notes_column is None
+
+    def test_suggest_unrecognised_columns(self):
+        """Test unrecognised headers give no suggestion instead of raising."""
+        assert suggest_column_mapping_from_columns(("id", "value")) is None
+        assert suggest_column_mapping_from_columns(("id", "Synonyms")) is None
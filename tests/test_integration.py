@@ -1,8 +1,10 @@
 """Integration tests for ChemScreen end-to-end workflows."""
 
+import asyncio
 import csv
 import json
 import tempfile
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
@@ -293,6 +295,24 @@ class TestEndToEndWorkflow:
         sessions_after = session_manager.list_sessions()
         assert len(sessions_after) == 0
 
+    def test_session_cleanup_keeps_recent(self, temp_dir):
+        """Test cleanup removes only expired sessions from disk and the index."""
+        session_manager = SessionManager(session_dir=temp_dir)
+        for batch_id, age_days in [("old_1", 40), ("old_2", 35), ("recent", 1)]:
+            session_manager.save_session(
+                BatchSearchSession(
+                    batch_id=batch_id,
+                    chemicals=[],
+                    parameters=SearchParameters(),
+                    created_at=datetime.now() - timedelta(days=age_days),
+                )
+            )
+
+        assert session_manager.cleanup_old_sessions(days_to_keep=30) == 2
+        assert [s["session_id"] for s in session_manager.list_sessions()] == ["recent"]
+        assert session_manager.load_session("old_1") is None
+        assert session_manager.load_session("recent") is not None
+
     def test_cache_integration(self, temp_dir, mock_search_results):
         """Test cache integration."""
         # Create cache manager
@@ -323,6 +343,102 @@ class TestEndToEndWorkflow:
         assert stats["total_files"] >= 1
         assert stats["valid_files"] >= 1
 
+    @pytest.mark.asyncio
+    async def test_batch_search_uses_cache(self, temp_dir, mock_search_results):
+        """Test that repeat batch searches are served from the cache."""
+        cache_manager = CacheManager(cache_dir=temp_dir, ttl_seconds=3600)
+        chemicals = [result.chemical for result in mock_search_results[:2]]
+
+        with patch("chemscreen.pubmed.PubMedClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_instance.search.side_effect = mock_search_results[:2]
+
+            first = await batch_search(
+                chemicals=chemicals,
+                max_results_per_chemical=50,
+                date_range_years=10,
+                include_reviews=True,
+                cache_manager=cache_manager,
+            )
+            second = await batch_search(
+                chemicals=chemicals,
+                max_results_per_chemical=50,
+                date_range_years=10,
+                include_reviews=True,
+                cache_manager=cache_manager,
+            )
+
+        assert mock_instance.search.call_count == 2
+        assert not any(result.from_cache for result in first)
+        assert all(result.from_cache for result in second)
+
+    @pytest.mark.asyncio
+    async def test_batch_search_limits_concurrency(self, mock_search_results):
+        """Test that max_concurrent bounds the searches in flight at once."""
+        results_by_name = {r.chemical.name: r for r in mock_search_results}
+        in_flight = 0
+        peak = 0
+
+        async def fake_search(chemical, *args):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return results_by_name[chemical.name]
+
+        with patch("chemscreen.pubmed.PubMedClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_instance.search.side_effect = fake_search
+
+            results = await batch_search(
+                chemicals=[r.chemical for r in mock_search_results],
+                max_results_per_chemical=50,
+                date_range_years=10,
+                include_reviews=True,
+                max_concurrent=2,
+            )
+
+        assert len(results) == len(mock_search_results)
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_search_keeps_input_order(self, mock_search_results):
+        """Test that results follow the input order, not completion order."""
+        results_by_name = {r.chemical.name: r for r in mock_search_results}
+        chemicals = [r.chemical for r in mock_search_results]
+        delays = {c.name: 0.01 * (len(chemicals) - i) for i, c in enumerate(chemicals)}
+        progress_names = []
+
+        async def fake_search(chemical, *args):
+            # Later chemicals finish first
+            await asyncio.sleep(delays[chemical.name])
+            return results_by_name[chemical.name]
+
+        async def progress_callback(progress, chemical):
+            progress_names.append(chemical.name)
+
+        with patch("chemscreen.pubmed.PubMedClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_instance.search.side_effect = fake_search
+
+            results = await batch_search(
+                chemicals=chemicals,
+                max_results_per_chemical=50,
+                date_range_years=10,
+                include_reviews=True,
+                progress_callback=progress_callback,
+                max_concurrent=len(chemicals),
+            )
+
+        names = [c.name for c in chemicals]
+        assert [r.chemical.name for r in results] == names
+        # Progress is still reported as each search completes
+        assert progress_names == names[::-1]
+
     @pytest.mark.asyncio
     async def test_complete_workflow_integration(self, temp_dir, sample_csv_file):
         """Test complete end-to-end workflow."""